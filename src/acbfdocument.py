@@ -61,6 +61,69 @@ import utils
 
 logger = logging.getLogger(__name__)
 
+# Text area types that can have their own font
+TEXT_AREA_FONT_TYPES = ["code", "commentary", "sign", "formal", "heading", "letter", "audio", "thought"]
+
+# Stylesheet selector (upper case) -> font style
+STYLE_SELECTORS: dict[str, str] = {
+    "P": "normal",
+    "TEXT-AREA": "normal",
+    "EMPHASIS": "emphasis",
+    "STRONG": "strong",
+    "CODE": "code",
+    "COMMENTARY": "commentary",
+    **{f"TEXT-AREA[TYPE={t.upper()}]": t for t in TEXT_AREA_FONT_TYPES},
+    **{f'TEXT-AREA[TYPE="{t.upper()}"]': t for t in TEXT_AREA_FONT_TYPES},
+}
+
+# Font style -> stylesheet selector and font colour it is saved with
+FONT_STYLE_RULES: dict[str, tuple[str, str]] = {
+    "normal": ("text-area", "speech"),
+    "emphasis": ("emphasis", "emphasis"),
+    "strong": ("strong", "strong"),
+    **{t: (f"text-area[type={t}]", t) for t in TEXT_AREA_FONT_TYPES},
+}
+
+# Stylesheet selector (upper case) -> font colour
+COLOR_SELECTORS: dict[str, str] = {
+    "*": "speech",
+    "TEXT-AREA[INVERTED=TRUE]": "inverted",
+    "TEXT-AREA[TYPE=SPEECH]": "speech",
+    "TEXT-AREA[TYPE=COMMENTARY]": "commentary",
+    "TEXT-AREA[TYPE=FORMAL]": "formal",
+    "TEXT-AREA[TYPE=LETTER]": "letter",
+    "TEXT-AREA[TYPE=CODE]": "code",
+    "TEXT-AREA[TYPE=HEADING]": "heading",
+    "TEXT-AREA[TYPE=AUDIO]": "audio",
+    "TEXT-AREA[TYPE=THOUGHT]": "thought",
+    "TEXT-AREA[TYPE=SIGN]": "sign",
+}
+
+# Author record key -> <author> child element, in the order they are saved
+AUTHOR_ELEMENTS: tuple[tuple[str, str], ...] = (
+    ("first_name", "first-name"),
+    ("middle_name", "middle-name"),
+    ("last_name", "last-name"),
+    ("email", "email"),
+    ("home_page", "home-page"),
+    ("nickname", "nickname"),
+)
+
+
+def _copy_if_changed(src: str, dst: str) -> None:
+    # fonts already copied for an earlier document are left alone
+    try:
+        if os.path.getsize(dst) == os.path.getsize(src):
+            return
+        os.remove(dst)
+    except OSError:
+        pass
+    try:
+        # nothing to copy when the temp directory is on the same filesystem, fonts there are only read
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 class ACBFDocument:
     def __init__(self, parent: Gtk.Window, filename: str):
@@ -93,7 +156,7 @@ class ACBFDocument:
         self.reading_direction: str = "LTR"
         self.has_frames: bool = False
         self.fonts_dir: str = os.path.join(self.parent.tempdir, "Fonts")
-        self.custom_fonts: dict[str, dict[str, str]] = {}  # filename stem: path, name, style, weight, stretch
+        self.custom_fonts: dict[str, dict[str, str]] = {}  # stem: path, name, style, weight, stretch, subfamily
         self.font_styles: dict[str, str] = {
             "normal": "",
             "emphasis": "",
@@ -132,6 +195,7 @@ class ACBFDocument:
             "audio": "#000000",
             "thought": "#000000",
         }
+        self.modified_styles: set[str] = set()  # styles given another font or colour since the last save
         for style in [
             "normal",
             "emphasis",
@@ -145,7 +209,7 @@ class ACBFDocument:
             "audio",
             "thought",
         ]:
-            self.font_styles[style] = constants.default_font
+            self.font_styles[style] = constants.get_default_font()
 
         if self.filename:
             try:
@@ -153,7 +217,9 @@ class ACBFDocument:
                 self.tree = xml.parse(source=filename)
                 root = self.tree.getroot()
 
-                for elem in root.getiterator():
+                # Strip the namespace from element tags. Elements only: comments and
+                # processing instructions have no string tag.
+                for elem in root.iter(xml.Element):
                     i = elem.tag.find("}")
                     if i >= 0:
                         elem.tag = elem.tag[i + 1 :]
@@ -203,35 +269,11 @@ class ACBFDocument:
             self.cover_thumb.thumbnail((200, 200), Image.Resampling.NEAREST)
 
         # Authors (mandatory)
-        for author in self.bookinfo.findall("author"):
-            first_name = middle_name = last_name = nickname = home_page = email = ""
-            if author.find("first-name") is not None:
-                first_name = author.find("first-name").text
-            if author.find("middle-name") is not None:
-                middle_name = author.find("middle-name").text
-            if author.find("last-name") is not None:
-                last_name = author.find("last-name").text
-            if author.find("nickname") is not None:
-                nickname = author.find("nickname").text
-            if author.find("home-page") is not None:
-                home_page = author.find("home-page").text
-            if author.find("email") is not None:
-                email = author.find("email").text
-
-            author_record = {
-                "activity": author.get("activity"),
-                "language": author.get("lang"),
-                "first_name": first_name,
-                "middle_name": middle_name,
-                "last_name": last_name,
-                "nickname": nickname,
-                "home_page": home_page,
-                "email": email,
-            }
-            self.authors.append(author_record)
+        for author in self.bookinfo.iterfind("author"):
+            self.authors.append(get_author_record(author))
 
         # book-title (mandatory)
-        for title in self.bookinfo.findall("book-title"):
+        for title in self.bookinfo.iterfind("book-title"):
             if title.get("lang") is None or title.get("lang") == "en":
                 self.book_title["en"] = escape(title.text)
             else:
@@ -245,14 +287,13 @@ class ACBFDocument:
             )[:-5]
 
         # genres (mandatory)
-        acbf_xml_genres: list[xml._Element] = self.bookinfo.findall("genre")
-        for g in acbf_xml_genres:
-            if g.text in constants.GENRES_LIST:
+        for g in self.bookinfo.iterfind("genre"):
+            if g.text in constants.GENRES_SET:
                 self.genres.append((g.text, int(g.get("match", 0))))
 
         # languages
         try:
-            for language in self.bookinfo.findall("languages/text-layer"):
+            for language in self.bookinfo.iterfind("languages/text-layer"):
                 show = False if language.get("show") == "False" else True
                 self.languages.append((language.get("lang"), show))
             if len(self.languages) == 0:
@@ -261,12 +302,8 @@ class ACBFDocument:
             pass
 
         # annotation (mandatory)
-        for annotation in self.bookinfo.findall("annotation"):
-            annotation_text = ""
-            for line in annotation.findall("p"):
-                if line.text is not None:
-                    annotation_text = annotation_text + line.text + "\n"
-            annotation_text = escape(annotation_text[:-1])
+        for annotation in self.bookinfo.iterfind("annotation"):
+            annotation_text = escape("\n".join(line.text for line in annotation.iterfind("p") if line.text is not None))
 
             if annotation.get("lang") is None:
                 self.annotation["??"] = annotation_text
@@ -278,7 +315,7 @@ class ACBFDocument:
 
         # sequence
         try:
-            for sequence in self.bookinfo.findall("sequence"):
+            for sequence in self.bookinfo.iterfind("sequence"):
                 name = sequence.get("title") or ""
                 volume = sequence.get("volume") or ""
                 number = sequence.text or ""
@@ -289,7 +326,7 @@ class ACBFDocument:
 
         # databaseref
         try:
-            for line in self.bookinfo.findall("databaseref"):
+            for line in self.bookinfo.iterfind("databaseref"):
                 if line.text is not None:
                     dbname = line.get("dbname", "")
                     dbtype = line.get("type", "")
@@ -301,20 +338,18 @@ class ACBFDocument:
             pass
 
         try:
-            for rating in self.bookinfo.findall("content-rating"):
+            for rating in self.bookinfo.iterfind("content-rating"):
                 self.content_ratings.append((rating.get("type"), rating.text))
         except Exception:
             pass
 
-        try:
-            direction = self.bookinfo.find("reading-direction")
+        direction = self.bookinfo.find("reading-direction")
+        if direction is not None and direction.text:
             self.reading_direction = direction.text
-        except Exception:
-            pass
 
         # characters
         try:
-            for line in self.bookinfo.findall("characters/" + "name"):
+            for line in self.bookinfo.iterfind("characters/" + "name"):
                 self.characters.append(line.text)
         except Exception:
             pass
@@ -325,11 +360,10 @@ class ACBFDocument:
         self.publisher = get_element_text(self.publishinfo, "publisher")
 
         # publish date (mandatory)
-        if self.publishinfo.find("publish-date") is not None:
-            if self.publishinfo.find("publish-date").get("value") is not None:
-                self.publish_date_value = self.publishinfo.find(
-                    "publish-date",
-                ).get("value")
+        publish_date = self.publishinfo.find("publish-date")
+        if publish_date is not None:
+            if publish_date.get("value") is not None:
+                self.publish_date_value = publish_date.get("value")
                 self.publish_date = " (" + self.publish_date_value + ")"
             self.publish_date = (
                 get_element_text(
@@ -346,50 +380,23 @@ class ACBFDocument:
         # document-info
 
         # doc author (mandatory)
-        for doc_author in self.docinfo.findall("author"):
-            first_name = middle_name = last_name = nickname = home_page = email = ""
-            if doc_author.find("first-name") is not None:
-                first_name = doc_author.find("first-name").text
-            if doc_author.find("middle-name") is not None:
-                middle_name = doc_author.find("middle-name").text
-            if doc_author.find("last-name") is not None:
-                last_name = doc_author.find("last-name").text
-            if doc_author.find("nickname") is not None:
-                nickname = doc_author.find("nickname").text
-            if doc_author.find("home-page") is not None:
-                home_page = doc_author.find("home-page").text
-            if doc_author.find("email") is not None:
-                email = doc_author.find("email").text
-
-            doc_author_record = {
-                "activity": doc_author.get("activity"),
-                "language": doc_author.get("lang"),
-                "first_name": first_name,
-                "middle_name": middle_name,
-                "last_name": last_name,
-                "nickname": nickname,
-                "home_page": home_page,
-                "email": email,
-            }
-            self.doc_authors.append(doc_author_record)
+        for doc_author in self.docinfo.iterfind("author"):
+            self.doc_authors.append(get_author_record(doc_author))
 
         # acbf doc creation date (mandatory)
-        try:
-            self.creation_date = self.docinfo.find(
-                "creation-date",
-            ).get("value")
+        creation_date = self.docinfo.find("creation-date")
+        if creation_date is not None:
+            self.creation_date = creation_date.get("value")
             if self.creation_date is None:
                 self.creation_date = get_element_text(
                     self.docinfo,
                     "creation-date",
                 )
-        except Exception:
-            self.creation_date = GLib.DateTime.new_now_local().format("%Y-%m-%d")
-        if self.creation_date == "":
+        if not self.creation_date:
             self.creation_date = GLib.DateTime.new_now_local().format("%Y-%m-%d")
 
         try:
-            for line in self.docinfo.findall("source/" + "p"):
+            for line in self.docinfo.iterfind("source/" + "p"):
                 self.sources.append(line.text)
         except Exception:
             pass
@@ -401,15 +408,13 @@ class ACBFDocument:
         self.version = get_element_text(self.docinfo, "version")
 
         try:
-            for line in self.docinfo.findall("history/" + "p"):
+            for line in self.docinfo.iterfind("history/" + "p"):
                 self.history.append(line.text)
         except Exception:
             pass
 
         # has frames
-        for page in self.pages:
-            for frame in page.findall("frame"):
-                self.has_frames = True
+        self.has_frames = any(page.find("frame") is not None for page in self.pages)
 
     def load_image(self, image_uri: ImageURI) -> Image:
         try:
@@ -463,20 +468,15 @@ class ACBFDocument:
 
     def load_page_frames(self, page_num: int = 1) -> list[tuple[list[tuple[int, int]], str]] | list[Any]:
         if page_num == 1:
-            xml_frames = self.bookinfo.findall("coverpage/" + "frame")
-            if xml_frames is None:
-                return []
+            xml_frames = self.bookinfo.iterfind("coverpage/" + "frame")
         else:
-            xml_frames = self.pages[page_num - 2].findall("frame")
+            xml_frames = self.pages[page_num - 2].iterfind("frame")
         frames = []
         coordinate_list = []
         for frame in xml_frames:
             for coordinate in frame.get("points").split(" "):
-                coordinate_tuple = (
-                    int(coordinate.split(",")[0]),
-                    int(coordinate.split(",")[1]),
-                )
-                coordinate_list.append(coordinate_tuple)
+                x, y = coordinate.split(",")
+                coordinate_list.append((int(x), int(y)))
             frame_tuple = (coordinate_list, frame.get("bgcolor", ""))
             frames.append(frame_tuple)
             coordinate_list = []
@@ -489,19 +489,18 @@ class ACBFDocument:
     ) -> tuple[list[tuple[list[tuple[int, int]], str, str, int, str, bool, bool]], list[tuple[str, str]]]:
         text_areas: list[tuple[list[tuple[int, int]], str, str, int, str, bool, bool]] = []
         references: list[tuple[str, str]] = []
-        all_lines = ""
         text_rotation = 0
         area_type = "speech"
         inverted = False
         if page_num == 1:
             return text_areas, references
-        for text_layer in self.pages[page_num - 2].findall("text-layer"):
+        for text_layer in self.pages[page_num - 2].iterfind("text-layer"):
             if text_layer.get("bgcolor") is not None:
                 bgcolor_layer = text_layer.get("bgcolor")
             else:
                 bgcolor_layer = "#ffffff"
             if text_layer.get("lang") == language:
-                for text_area in text_layer.findall("text-area"):
+                for text_area in text_layer.iterfind("text-area"):
                     if text_area.get("bgcolor") is not None:
                         bgcolor = text_area.get("bgcolor")
                     else:
@@ -527,50 +526,35 @@ class ACBFDocument:
                     else:
                         transparent = False
                     coordinate_list = []
-                    area_text = ""
+                    paragraphs: list[str] = []
                     for coordinate in text_area.get("points").split(" "):
-                        coordinate_tuple = (
-                            int(coordinate.split(",")[0]),
-                            int(coordinate.split(",")[1]),
+                        x, y = coordinate.split(",")
+                        coordinate_list.append((int(x), int(y)))
+                    for paragraph in text_area.iterfind("p"):
+                        paragraphs.append(
+                            re.sub(
+                                r"<p[^>]*>",
+                                "",
+                                xml.tostring(
+                                    paragraph,
+                                    encoding="Unicode",
+                                    with_tail=False,
+                                ),
+                            ).replace("</p>", " <BR>")
                         )
-                        coordinate_list.append(coordinate_tuple)
-                    for paragraph in text_area.findall("p"):
-                        area_text = area_text + re.sub(
-                            r"<p[^>]*>",
-                            "",
-                            xml.tostring(
-                                paragraph,
-                                encoding="Unicode",
-                                with_tail=False,
-                            ),
-                        ).replace("</p>", " <BR>")
-                        # references
-                        for reference in paragraph.findall("a"):
-                            for item in self.references.findall("reference"):
-                                if item.get("id") == reference.get("href")[1:]:
-                                    all_lines = ""
-                                    for line in item.findall("p"):
-                                        all_lines = all_lines + line.text + "\n"
-                                    all_lines = all_lines[:-2]
-                                    references.append(
-                                        (reference.get("href")[1:], all_lines),
-                                    )
-                        for commentary in paragraph.findall("commentary"):
-                            for reference in commentary.findall("a"):
-                                for item in self.references.findall("reference"):
+                        # references, in the paragraph and in its commentaries
+                        for path in ("a", "commentary/a"):
+                            for reference in paragraph.iterfind(path):
+                                for item in self.references.iterfind("reference"):
                                     if item.get("id") == reference.get("href")[1:]:
-                                        all_lines = ""
-                                        for line in item.findall("p"):
-                                            all_lines = all_lines + line.text + "\n"
-                                        all_lines = all_lines[:-2]
+                                        all_lines = "\n".join(
+                                            line.text for line in item.iterfind("p") if line.text is not None
+                                        )
                                         references.append(
-                                            (
-                                                reference.get("href")[1:],
-                                                all_lines,
-                                            ),
+                                            (reference.get("href")[1:], all_lines),
                                         )
 
-                    area_text = area_text[:-5]
+                    area_text = "".join(paragraphs)[:-5]
                     text_area_tuple = (
                         coordinate_list,
                         area_text,
@@ -596,13 +580,15 @@ class ACBFDocument:
         for lang in self.languages:
             contents = []
             for idx, page in enumerate(self.pages, start=2):
-                for title in page.findall("title"):
+                for title in page.iterfind("title"):
                     if (title.get("lang") == lang[0]) or (title.get("lang") is None):
                         contents.append((title.text, str(idx)))
             self.contents_table = contents
 
     def load_stylesheet(self) -> None:
         font = ""
+        custom_families = utils.group_fonts_by_family(self.custom_fonts)
+        resolved_fonts: dict[tuple[str, str, str, str], str] = {}
 
         for rule in self.stylesheet.text.replace("\n", " ").split("}"):
             if rule.strip() != "":
@@ -625,142 +611,87 @@ class ACBFDocument:
                         elif current_style == "FONT-STRETCH":
                             font_stretch = style.split(":")[1].strip().casefold()
 
-                        if selector == "*" and current_style == "COLOR":
-                            self.font_colors["speech"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[INVERTED=TRUE]" and current_style == "COLOR":
-                            self.font_colors["inverted"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[TYPE=SPEECH]" and current_style == "COLOR":
-                            self.font_colors["speech"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[TYPE=COMMENTARY]" and current_style == "COLOR":
-                            self.font_colors["commentary"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[TYPE=FORMAL]" and current_style == "COLOR":
-                            self.font_colors["formal"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[TYPE=LETTER]" and current_style == "COLOR":
-                            self.font_colors["letter"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[TYPE=CODE]" and current_style == "COLOR":
-                            self.font_colors["code"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[TYPE=HEADING]" and current_style == "COLOR":
-                            self.font_colors["heading"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[TYPE=AUDIO]" and current_style == "COLOR":
-                            self.font_colors["audio"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[TYPE=THOUGHT]" and current_style == "COLOR":
-                            self.font_colors["thought"] = style.split(":")[1].strip().strip('"')
-                        elif selector == "TEXT-AREA[TYPE=SIGN]" and current_style == "COLOR":
-                            self.font_colors["sign"] = style.split(":")[1].strip().strip('"')
+                        if current_style == "COLOR" and selector in COLOR_SELECTORS:
+                            self.font_colors[COLOR_SELECTORS[selector]] = style.split(":")[1].strip().strip('"')
 
                 if font_families != "":
-                    font = ""
-                    for font_family in font_families.split(","):
-                        if font:
-                            continue
-                        font_family = font_family.strip().strip('"').casefold()
-                        font_family_split = font_family.split(".")[0]
-                        # check if font exists in acbf document
-                        # Is it a font filename?
-                        if "." in font_family:
-                            # Check our bundled fonts first
-                            find_font = self.custom_fonts.get(font_family_split)
-                            if find_font is None:
-                                # Check system fonts
-                                find_font = constants.SYSTEM_FONT_LIST.get(font_family_split)
-                            font = find_font["path"] if find_font is not None else ""
-
-                        if not font:
-                            # Not a filename, check names and styles
-                            found_family_list = {}
-                            for font_id, font_info in self.custom_fonts.items():
-                                if font_family == font_info["name"].casefold():
-                                    found_family_list[font_id] = font_info
-
-                            if len(found_family_list) == 0:
-                                # Check system fonts
-                                for font_id, font_info in constants.SYSTEM_FONT_LIST.items():
-                                    if font_family == font_info["name"].casefold():
-                                        found_family_list[font_id] = font_info
-
-                            found_style_list: dict[str, dict[str, str]] = {}
-                            if len(found_family_list) > 0:
-                                # Check each matching family found for matching style attributes
-                                for font_id, font_info in found_family_list.items():
-                                    if (
-                                        font_style == font_info["style"]
-                                        and font_weight == font_info["weight"]
-                                        and font_stretch == font_info["stretch"]
-                                    ):
-                                        # Perfect match
-                                        font = font_info["path"]
-                                        break
-                                    elif font_style == "italic" or "oblique":
+                    # styles sharing a font are matched against the font lists once
+                    font_key = (font_families, font_style, font_weight, font_stretch)
+                    font = resolved_fonts.get(font_key, "")
+                    if not font:
+                        font = ""
+                        for font_family in font_families.split(","):
+                            if font:
+                                continue
+                            font_family = font_family.strip().strip('"').casefold()
+                            font_family_split = font_family.split(".")[0]
+                            # check if font exists in acbf document
+                            # Is it a font filename?
+                            if "." in font_family:
+                                # Check our bundled fonts first
+                                find_font = self.custom_fonts.get(font_family_split)
+                                if find_font is None:
+                                    # Check system fonts
+                                    find_font = constants.get_system_fonts().get(font_family_split)
+                                font = find_font["path"] if find_font is not None else ""
+
+                            if not font:
+                                # Not a filename, check names and styles (bundled fonts first, then system fonts)
+                                found_family_list = custom_families.get(
+                                    font_family
+                                ) or constants.get_system_font_families().get(font_family, {})
+
+                                found_style_list: dict[str, dict[str, str]] = {}
+                                if len(found_family_list) > 0:
+                                    # Check each matching family found for matching style attributes
+                                    for font_id, font_info in found_family_list.items():
                                         if (
-                                            (font_info["style"] == "italic" or font_info["style"] == "oblique")
+                                            font_style == font_info["style"]
                                             and font_weight == font_info["weight"]
                                             and font_stretch == font_info["stretch"]
                                         ):
                                             # Perfect match
                                             font = font_info["path"]
                                             break
-                                    else:
-                                        if font_style == font_info["style"] and font_weight == font_info["weight"]:
-                                            found_style_list[font_id] = font_info
-                                        elif font_style == font_info["style"] and font_stretch == font_info["stretch"]:
-                                            found_style_list[font_id] = font_info
-                                        elif (
-                                            font_weight == font_info["weight"] and font_stretch == font_info["stretch"]
-                                        ):
-                                            found_style_list[font_id] = font_info
+                                        elif font_style == "italic" or "oblique":
+                                            if (
+                                                (font_info["style"] == "italic" or font_info["style"] == "oblique")
+                                                and font_weight == font_info["weight"]
+                                                and font_stretch == font_info["stretch"]
+                                            ):
+                                                # Perfect match
+                                                font = font_info["path"]
+                                                break
+                                        else:
+                                            if font_style == font_info["style"] and font_weight == font_info["weight"]:
+                                                found_style_list[font_id] = font_info
+                                            elif (
+                                                font_style == font_info["style"]
+                                                and font_stretch == font_info["stretch"]
+                                            ):
+                                                found_style_list[font_id] = font_info
+                                            elif (
+                                                font_weight == font_info["weight"]
+                                                and font_stretch == font_info["stretch"]
+                                            ):
+                                                found_style_list[font_id] = font_info
+
+                                if not font and len(found_style_list) > 0:
+                                    # Didn't find a perfect match, use next best
+                                    if len(found_style_list) > 0:
+                                        font = next(iter(found_style_list.values()))["path"]
 
-                            if not font and len(found_style_list) > 0:
-                                # Didn't find a perfect match, use next best
-                                if len(found_style_list) > 0:
-                                    font = next(iter(found_style_list.values()))["path"]
+                        if not font:
+                            logging.warning(
+                                f"Failed to find any requested fonts: {font_families}. Using default {constants.get_default_font()}"
+                            )
+                            font = constants.get_default_font()
+                        resolved_fonts[font_key] = font
 
-                    if not font:
-                        logging.warning(
-                            f"Failed to find any requested fonts: {font_families}. Using default {constants.default_font}"
-                        )
-                        font = constants.default_font
-
-                if selector in ("P", "TEXT-AREA") and font != "":
-                    self.font_styles["normal"] = font
-                    self.font_families["normal"] = font_families
-                elif selector == "EMPHASIS" and font != "":
-                    self.font_styles["emphasis"] = font
-                    self.font_families["emphasis"] = font_families
-                elif selector == "STRONG" and font != "":
-                    self.font_styles["strong"] = font
-                    self.font_families["strong"] = font_families
-                elif selector in ("CODE", "TEXT-AREA[TYPE=CODE]", 'TEXT-AREA[TYPE="CODE"]') and font != "":
-                    self.font_styles["code"] = font
-                    self.font_families["code"] = font_families
-                elif (
-                    selector
-                    in (
-                        "COMMENTARY",
-                        "TEXT-AREA[TYPE=COMMENTARY]",
-                        'TEXT-AREA[TYPE="COMMENTARY"]',
-                    )
-                    and font != ""
-                ):
-                    self.font_styles["commentary"] = font
-                    self.font_families["commentary"] = font_families
-                elif selector in ("TEXT-AREA[TYPE=SIGN]", 'TEXT-AREA[TYPE="SIGN"]') and font != "":
-                    self.font_styles["sign"] = font
-                    self.font_families["sign"] = font_families
-                elif selector in ("TEXT-AREA[TYPE=FORMAL]", 'TEXT-AREA[TYPE="FORMAL"]') and font != "":
-                    self.font_styles["formal"] = font
-                    self.font_families["formal"] = font_families
-                elif selector in ("TEXT-AREA[TYPE=HEADING]", 'TEXT-AREA[TYPE="HEADING"]') and font != "":
-                    self.font_styles["heading"] = font
-                    self.font_families["heading"] = font_families
-                elif selector in ("TEXT-AREA[TYPE=LETTER]", 'TEXT-AREA[TYPE="LETTER"]') and font != "":
-                    self.font_styles["letter"] = font
-                    self.font_families["letter"] = font_families
-                elif selector in ("TEXT-AREA[TYPE=AUDIO]", 'TEXT-AREA[TYPE="AUDIO"]') and font != "":
-                    self.font_styles["audio"] = font
-                    self.font_families["audio"] = font_families
-                elif selector in ("TEXT-AREA[TYPE=THOUGHT]", 'TEXT-AREA[TYPE="THOUGHT"]') and font != "":
-                    self.font_styles["thought"] = font
-                    self.font_families["thought"] = font_families
+                font_type = STYLE_SELECTORS.get(selector)
+                if font_type is not None and font != "":
+                    self.font_styles[font_type] = font
+                    self.font_families[font_type] = font_families
 
         for style in [
             "emphasis",
@@ -774,35 +705,25 @@ class ACBFDocument:
             "audio",
             "thought",
         ]:
-            if self.font_styles[style] == constants.default_font:
+            if self.font_styles[style] == constants.get_default_font():
                 self.font_styles[style] = self.font_styles["normal"]
-
-        for style in [
-            "emphasis",
-            "strong",
-            "code",
-            "commentary",
-            "sign",
-            "formal",
-            "heading",
-            "letter",
-            "audio",
-            "thought",
-        ]:
-            if self.font_families[style] == constants.default_font:
+            if self.font_families[style] == constants.get_default_font():
                 self.font_families[style] = self.font_families["normal"]
 
     def extract_fonts(self) -> None:
-        if os.path.exists(os.path.join(self.base_dir, "Fonts")) and not os.path.exists(self.fonts_dir):
-            shutil.copytree(os.path.join(self.base_dir, "Fonts"), self.fonts_dir)
-        if not os.path.exists(self.fonts_dir):
-            os.makedirs(self.fonts_dir, 0o700)
+        os.makedirs(self.fonts_dir, 0o700, exist_ok=True)
+        # fonts next to an unpacked document, unless it was unpacked into the temp directory itself
+        source_fonts_dir = os.path.join(self.base_dir, "Fonts")
+        if os.path.isdir(source_fonts_dir) and not os.path.samefile(source_fonts_dir, self.fonts_dir):
+            shutil.copytree(source_fonts_dir, self.fonts_dir, copy_function=_copy_if_changed, dirs_exist_ok=True)
+        # One directory read instead of a stat per embedded font
+        existing_fonts = {entry.name for entry in os.scandir(self.fonts_dir)}
         for font in self.binaries:
-            if font.get("content-type") == "application/font-sfnt":
-                decoded = base64.b64decode(font.text)
-                f = open(os.path.join(self.fonts_dir, font.get("id")), "wb")
-                f.write(decoded)
-                f.close()
+            font_id = font.get("id")
+            if font.get("content-type") == "application/font-sfnt" and font_id not in existing_fonts:
+                with open(os.path.join(self.fonts_dir, font_id), "wb") as f:
+                    f.write(base64.b64decode(font.text))
+                existing_fonts.add(font_id)
 
     def save_to_tree(self) -> None:
         """Save new data to self.tree"""
@@ -851,10 +772,35 @@ class ACBFDocument:
             else:
                 return ele
 
+        def replace_authors(info_element: xml._Element, authors: list[dict[str, str]]) -> None:
+            # book and document authors are written the same way, each under its own info element
+            for item in info_element.findall("author"):
+                info_element.remove(item)
+            for a in authors:
+                activity = a.get("activity") or "Writer"
+                if activity == "Translator":
+                    lang = a.get("language", "en")
+                    # Possible get('language') returns None
+                    if lang is None:
+                        lang = "en"
+                    element = xml.SubElement(info_element, "author", activity="Translator", lang=lang)
+                else:
+                    element = xml.SubElement(info_element, "author", activity=activity)
+
+                for key, tag in AUTHOR_ELEMENTS:
+                    if a.get(key):
+                        xml.SubElement(element, tag).text = a[key]
+
+        # paths already looked up during this save, the containers are never removed here
+        resolved_elements: dict[str, xml._Element] = {}
+
         def get_or_create_element(tag: str) -> xml._Element:
-            element = self.tree.find(tag)
+            element = resolved_elements.get(tag)
             if element is None:
-                element = add_path(tag)
+                element = self.tree.find(tag)
+                if element is None:
+                    element = add_path(tag)
+                resolved_elements[tag] = element
             return element
 
         def modify_element(path: str, value: Any, attribs: dict[str, str] | None = None) -> None:
@@ -866,7 +812,7 @@ class ACBFDocument:
 
             element_parent = get_or_create_element(element_path)
 
-            element = self.tree.find(path)
+            element = element_parent.find(element_name)
             if element is None:
                 try:
                     element = xml.SubElement(element_parent, element_name)
@@ -888,133 +834,110 @@ class ACBFDocument:
                 for e in element_parent.findall(element_name):
                     element_parent.remove(e)
 
-        for i in self.tree.findall("meta-data/book-info/book-title"):
-            self.tree.find("meta-data/book-info").remove(i)
+        bookinfo = get_or_create_element("meta-data/book-info")
+
+        # update titles in place, only adding and removing the languages that changed
+        existing_titles: dict[str, xml._Element] = {}
+        for title_element in bookinfo.findall("book-title"):
+            title_lang = title_element.get("lang", "en")
+            if title_lang in existing_titles:
+                bookinfo.remove(title_element)
+            else:
+                existing_titles[title_lang] = title_element
         for lang, title in self.book_title.items():
-            ele: xml._Element = xml.SubElement(
-                self.tree.find("meta-data/book-info"),
-                "book-title",
-            )
-            ele.text = str(title)
-            ele.attrib["lang"] = lang
+            title_element = existing_titles.pop(lang, None)
+            if title_element is None:
+                if not title:
+                    # a language nobody has given a title yet
+                    continue
+                title_element = xml.SubElement(bookinfo, "book-title")
+            title_element.text = str(title)
+            title_element.attrib["lang"] = lang
+        for title_element in existing_titles.values():
+            bookinfo.remove(title_element)
 
         # Only need to set URI as frames editor will save text and frames etc.
         if self.cover_page_uri is not None:
             coverpage_image = get_or_create_element("meta-data/book-info/coverpage/image")
             coverpage_image.attrib["href"] = self.cover_page_uri.file_path
 
-        for i in self.tree.findall("meta-data/book-info/annotation"):
-            self.tree.find("meta-data/book-info").remove(i)
-        for anno in list(self.annotation.items()):
-            if anno[0] == "??" and anno[1] is not None and anno[1] != "":
-                new_anno = xml.SubElement(
-                    self.tree.find(
-                        "meta-data/book-info",
-                    ),
-                    "annotation",
-                )
-                for line in anno[1].split("\n"):
-                    new_line = xml.SubElement(new_anno, "p")
-                    new_line.text = str(line)
-            elif anno[1] is not None and anno[1] != "":
-                new_anno = xml.SubElement(
-                    self.tree.find(
-                        "meta-data/book-info",
-                    ),
-                    "annotation",
-                    lang=anno[0],
-                )
-                for line in anno[1].split("\n"):
-                    new_line = xml.SubElement(new_anno, "p")
-                    new_line.text = str(line)
+        # annotations are matched by language the same way, unchanged ones are left alone
+        existing_annotations: dict[str, xml._Element] = {}
+        for anno_element in bookinfo.findall("annotation"):
+            anno_lang = anno_element.get("lang", "??")
+            if anno_lang in existing_annotations:
+                bookinfo.remove(anno_element)
+            else:
+                existing_annotations[anno_lang] = anno_element
+        for lang, anno in self.annotation.items():
+            if not anno:
+                continue
+            lines = anno.split("\n")
+            anno_element = existing_annotations.pop(lang, None)
+            if anno_element is not None and [line.text for line in anno_element] == lines:
+                continue
+            # parse all paragraphs in one go rather than adding them one by one
+            paragraphs = xml.fromstring(
+                "<annotation>" + "".join(f"<p>{escape(line)}</p>" for line in lines) + "</annotation>"
+            )
+            if anno_element is None:
+                if lang != "??":
+                    paragraphs.attrib["lang"] = lang
+                bookinfo.append(paragraphs)
+            else:
+                del anno_element[:]
+                anno_element.extend(paragraphs)
+        for anno_element in existing_annotations.values():
+            bookinfo.remove(anno_element)
 
         # book authors
-        for item in self.tree.findall("meta-data/book-info/author"):
-            self.tree.find("meta-data/book-info").remove(item)
-        for a in self.authors:
-            activity = a.get("activity") or "Writer"
-            if activity == "Translator":
-                lang = a.get("language", "en")
-                # Possible get('language') returns None
-                if lang is None:
-                    lang = "en"
-                element = xml.SubElement(
-                    get_or_create_element("meta-data/book-info"),
-                    "author",
-                    activity="Translator",
-                    lang=lang,
-                )
-            else:
-                element = xml.SubElement(
-                    get_or_create_element("meta-data/book-info"),
-                    "author",
-                    activity=activity,
-                )
+        replace_authors(bookinfo, self.authors)
 
-            if a.get("first_name"):
-                add_element(element, "first-name", a["first_name"])
-            if a.get("middle_name"):
-                add_element(element, "middle-name", a["middle_name"])
-            if a.get("last_name"):
-                add_element(element, "last-name", a["last_name"])
-            if a.get("email"):
-                add_element(element, "email", a["email"])
-            if a.get("home_page"):
-                add_element(element, "home-page", a["home_page"])
-            if a.get("nickname"):
-                add_element(element, "nickname", a["nickname"])
-
-        for item in self.tree.findall("meta-data/book-info/sequence"):
-            self.tree.find("meta-data/book-info").remove(item)
+        for item in bookinfo.findall("sequence"):
+            bookinfo.remove(item)
         for s in self.sequences:
-            ele = xml.SubElement(
-                get_or_create_element("meta-data/book-info"),
-                "sequence",
-            )
+            ele = xml.SubElement(bookinfo, "sequence")
             ele.text = s[2]
             ele.attrib["title"] = s[0]
             if s[1]:
                 ele.attrib["volume"] = s[1]
 
-        for item in self.tree.findall("meta-data/book-info/genre"):
-            get_or_create_element("meta-data/book-info").remove(item)
+        for item in bookinfo.findall("genre"):
+            bookinfo.remove(item)
         for g in self.genres:
-            element = xml.SubElement(
-                get_or_create_element(
-                    "meta-data/book-info",
-                ),
-                "genre",
-            )
+            element = xml.SubElement(bookinfo, "genre")
             element.text = g[0]
             if g[1]:
                 element.attrib["match"] = str(g[1])
 
-        get_or_create_element("meta-data/book-info/characters").clear()
+        characters = get_or_create_element("meta-data/book-info/characters")
+        characters.clear()
         for c in self.characters:
-            add_element(self.tree.find("meta-data/book-info/characters"), "name", c)
+            add_element(characters, "name", c)
 
         modify_element("meta-data/book-info/keywords", ", ".join(self.keywords))
 
-        for item in self.tree.findall("meta-data/book-info/languages/text-layer"):
-            self.tree.find("meta-data/book-info/languages").remove(item)
+        languages = get_or_create_element("meta-data/book-info/languages")
+        for item in languages.findall("text-layer"):
+            languages.remove(item)
         for lang_tup in self.languages:
-            element = xml.SubElement(get_or_create_element("meta-data/book-info/languages"), "text-layer")
+            element = xml.SubElement(languages, "text-layer")
             element.attrib["lang"] = lang_tup[0]
             element.attrib["show"] = str(lang_tup[1])
 
-        for item in self.tree.findall("meta-data/book-info/databaseref"):
-            self.tree.find("meta-data/book-info").remove(item)
+        for item in bookinfo.findall("databaseref"):
+            bookinfo.remove(item)
         for d in self.databaseref:
-            element = xml.SubElement(get_or_create_element("meta-data/book-info"), "databaseref")
+            element = xml.SubElement(bookinfo, "databaseref")
             element.text = d["value"]
             element.attrib["dbname"] = d["dbname"]
             if d.get("dbtype"):
                 element.attrib["type"] = d["dbtype"]
 
-        for item in self.tree.findall("meta-data/book-info/content-rating"):
-            get_or_create_element("meta-data/book-info").remove(item)
+        for item in bookinfo.findall("content-rating"):
+            bookinfo.remove(item)
         for r in self.content_ratings:
-            element = xml.SubElement(get_or_create_element("meta-data/book-info"), "content-rating")
+            element = xml.SubElement(bookinfo, "content-rating")
             element.text = r[1]
             if r[0]:
                 element.attrib["type"] = r[0]
@@ -1038,77 +961,46 @@ class ACBFDocument:
         modify_element("meta-data/document-info/id", self.id)
 
         # ACBF document authors
-        for item in self.tree.findall("meta-data/document-info/author"):
-            get_or_create_element("meta-data/document-info").remove(item)
-        for a in self.doc_authors:
-            activity = a.get("activity") or "Writer"
-            if activity == "Translator":
-                lang = a.get("language", "en")
-                # Possible get('language') returns None
-                if lang is None:
-                    lang = "en"
-                element = xml.SubElement(
-                    get_or_create_element("meta-data/document-info"),
-                    "author",
-                    activity="Translator",
-                    lang=lang,
-                )
-            else:
-                element = xml.SubElement(
-                    get_or_create_element("meta-data/document-info"),
-                    "author",
-                    activity=activity,
-                )
-
-            if a.get("first_name"):
-                add_element(element, "first-name", a["first_name"])
-            if a.get("middle_name"):
-                add_element(element, "middle-name", a["middle_name"])
-            if a.get("last_name"):
-                add_element(element, "last-name", a["last_name"])
-            if a.get("email"):
-                add_element(element, "email", a["email"])
-            if a.get("home_page"):
-                add_element(element, "home-page", a["home_page"])
-            if a.get("nickname"):
-                add_element(element, "nickname", a["nickname"])
+        replace_authors(get_or_create_element("meta-data/document-info"), self.doc_authors)
 
         cd = get_or_create_element("meta-data/document-info/creation-date")
         cd.text = self.creation_date
         cd.attrib["value"] = self.creation_date
 
-        get_or_create_element("meta-data/document-info/source").clear()
+        sources = get_or_create_element("meta-data/document-info/source")
+        sources.clear()
         for source in self.sources:
-            add_element(get_or_create_element("meta-data/document-info/source"), "p", source)
+            add_element(sources, "p", source)
 
         if self.version:
             modify_element("meta-data/document-info/version", self.version)
 
-        get_or_create_element("meta-data/document-info/history").clear()
+        history = get_or_create_element("meta-data/document-info/history")
+        history.clear()
         for h in self.history:
-            add_element(get_or_create_element("meta-data/document-info/history"), "p", h)
-
-        # Save fonts
-        all_styles = ""
-        for type, style in self.font_styles.items():
-            if style:
-                style = os.path.basename(style)
-                families = self.font_families[type].split(", ")
-                families[0] = style
-                style = ", ".join(families)
-                if type in ["code", "letter", "commentary", "formal", "heading", "audio", "thought", "sign"]:
-                    all_styles += f'text-area[type={type}] {{font-family: "{style}"; '
-                elif type in ["emphasis", "strong"]:
-                    all_styles += f'{type} {{font-family: "{style}"; '
-                else:
-                    all_styles += f'text-area {{font-family: "{style}"; '
-
-                all_styles += f'color: "{self.font_colors.get(type, "#000000")}";}}\n'
+            add_element(history, "p", h)
+
+        # Save fonts, the loaded stylesheet is kept as it is until a style is edited
+        if self.modified_styles or self.tree.find("style") is None:
+            all_styles: list[str] = []
+            for type, style in self.font_styles.items():
+                if style:
+                    families = self.font_families[type].split(", ")
+                    families[0] = os.path.basename(style)
+                    selector, colour = FONT_STYLE_RULES.get(type, ("text-area", type))
+                    all_styles.append(
+                        f'{selector} {{font-family: "{", ".join(families)}"; '
+                        f'color: "{self.font_colors.get(colour, "#000000")}";}}\n'
+                    )
 
-        if all_styles:
-            xml_styles = get_or_create_element("style")
-            xml_styles.attrib["type"] = "text/css"
-            xml_styles.text = all_styles
+            if all_styles:
+                style_text = "".join(all_styles)
+                xml_styles = get_or_create_element("style")
+                # styles edited back to what they were leave the stylesheet as it is
+                if xml_styles.text != style_text:
+                    xml_styles.attrib["type"] = "text/css"
+                    xml_styles.text = style_text
+            self.modified_styles.clear()
 
         xml.indent(self.tree)
 
@@ -1143,10 +1035,17 @@ class ImageURI:
 
 # function to retrieve text value from element without throwing exception
 def get_element_text(element_tree: xml._Element, element: str) -> str:
-    try:
-        text_value = escape(element_tree.find(element).text)
-        if text_value is None:
-            text_value = ""
-    except Exception:
-        text_value = ""
-    return text_value
+    # most optional elements are missing, find gives None for those rather than raising
+    found = element_tree.find(element)
+    if found is None or found.text is None:
+        return ""
+    return escape(found.text)
+
+
+# function to build an author record (as used by authors and doc_authors) from an <author> element
+def get_author_record(author: xml._Element) -> dict[str, str]:
+    author_record = {"activity": author.get("activity"), "language": author.get("lang")}
+    for key, tag in AUTHOR_ELEMENTS:
+        name_element = author.find(tag)
+        author_record[key] = name_element.text if name_element is not None else ""
+    return author_record
@@ -19,6 +19,7 @@ https://github.com/GeoRW/ACBF-Editor
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
 import utils
@@ -76,6 +77,7 @@ GENRES_LIST = [
     "superhero",
     "western",
 ]
+GENRES_SET = frozenset(GENRES_LIST)
 AUTHORS_LIST = [
     "Writer",
     "Adapter",
@@ -91,6 +93,8 @@ AUTHORS_LIST = [
     "Translator",
     "Other",
 ]
+# activity: position in AUTHORS_LIST, for selecting it in a dropdown
+ACTIVITY_TO_IDX = {activity: idx for idx, activity in enumerate(AUTHORS_LIST)}
 LANGUAGES = [
     "??#",
     "aa",
@@ -278,13 +282,26 @@ LANGUAGES = [
     "zh",
     "zu",
 ]
+# language: position in LANGUAGES, for selecting it in a dropdown
+LANGUAGES_INDEX = {lang: idx for idx, lang in enumerate(LANGUAGES)}
 
-# Create system font list
-SYSTEM_FONT_LIST: dict[str, dict[str, str]] = (
-    utils.findSystemFonts()
-)  # filename stem: full path, family name, style, weight, stretch
-default_font = ""
-if SYSTEM_FONT_LIST.get("arial"):
-    default_font = SYSTEM_FONT_LIST.get("arial", {})["path"]
-elif SYSTEM_FONT_LIST.get("dejavusans"):
-    default_font = SYSTEM_FONT_LIST.get("dejavusans", {})["path"]
+
+# The system fonts are only scanned when something first asks for them, not when this module is imported
+@functools.cache
+def get_system_fonts() -> dict[str, dict[str, str]]:
+    # filename stem: full path, family name, style, weight, stretch, subfamily
+    return utils.findSystemFonts(cache_file=os.path.join(DATA_DIR, "fonts.json"))
+
+
+@functools.cache
+def get_system_font_families() -> dict[str, dict[str, dict[str, str]]]:
+    return utils.group_fonts_by_family(get_system_fonts())
+
+
+@functools.cache
+def get_default_font() -> str:
+    system_fonts = get_system_fonts()
+    for stem in ("arial", "dejavusans"):
+        if system_fonts.get(stem):
+            return system_fonts[stem]["path"]
+    return ""
@@ -13,6 +13,7 @@
 # -------------------------------------------------------------------------
 from __future__ import annotations
 from acbfdocument import ImageURI
+from fileprepare import IMAGE_EXTENSIONS
 
 import gi
 from gi.repository import Gio
@@ -47,7 +48,7 @@ class CoverDialog(Gtk.Window):
         for file in self.parent.file_list:
             if str(file) == self.parent.acbf_document.cover_page_uri.file_path:
                 self.model.append(PageImage(image=self.parent.acbf_document.cover_page_uri.file_path, is_cover=True))
-            elif str(file).endswith((".jpg", ".png")):
+            elif str(file).lower().endswith(IMAGE_EXTENSIONS):
                 self.model.append(PageImage(image=file))
 
         selection_model = Gtk.SingleSelection(model=self.model)
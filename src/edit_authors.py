@@ -87,6 +87,8 @@ class AuthorsDialog(Gtk.Window):
         self.connect("close-request", self.save_and_exit)
 
         self.model: Gio.ListStore = Gio.ListStore.new(item_type=Author)
+        # one list of activities shared by every row's dropdown
+        self.activity_list = Gtk.StringList.new(constants.AUTHORS_LIST)
 
         self.authors = self.parent.acbf_document.doc_authors if doc_auth else self.parent.acbf_document.authors
 
@@ -174,10 +176,9 @@ class AuthorsDialog(Gtk.Window):
         list_item.set_child(entry)
 
     def setup_activity_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
-        gtk_lang_list = Gtk.StringList.new(constants.AUTHORS_LIST)
         entry = Gtk.DropDown()
         entry.set_show_arrow(True)
-        entry.set_model(gtk_lang_list)
+        entry.set_model(self.activity_list)
         entry.set_enable_search(True)
         expression = Gtk.PropertyExpression.new(
             Gtk.StringObject,
@@ -212,11 +213,7 @@ class AuthorsDialog(Gtk.Window):
     def bind_activity_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem, attribute: str) -> None:
         item: Author = list_item.get_item()
         entry: Gtk.DropDown = list_item.get_child()
-        entry.set_selected(
-            constants.AUTHORS_LIST.index(
-                getattr(item, attribute) or constants.AUTHORS_LIST[0],
-            ),
-        )
+        entry.set_selected(constants.ACTIVITY_TO_IDX.get(getattr(item, attribute), 0))
 
         entry.connect("notify::selected", self.activity_change, item)
 
@@ -228,7 +225,7 @@ class AuthorsDialog(Gtk.Window):
         item: Author = list_item.get_item()
         entry: Gtk.DropDown = list_item.get_child()
         entry.set_sensitive(False)
-        position = self.compare_lang(item, entry.get_model())
+        position = self.compare_lang(item)
         entry.set_selected(position)
         if item.activity == "Translator":
             entry.set_sensitive(True)
@@ -276,11 +273,11 @@ class AuthorsDialog(Gtk.Window):
         self.set_modified()
 
     def activity_change(self, button: Gtk.DropDown, _pspec: GObject.GParamSpec, item: Author) -> None:
-        # Don't trigger model change
-        item.activity = button.get_selected_item().get_string().capitalize()
+        # Don't trigger model change, the string is already as listed in AUTHORS_LIST
+        item.activity = button.get_selected_item().get_string()
         self.set_modified()
 
-    def compare_lang(self, item: Author, model: Gio.ListStore) -> int:
+    def compare_lang(self, item: Author) -> int:
         lang_iso = item.language
         if lang_iso is None:
             # If not the translator for a language, use currently set language
@@ -289,18 +286,7 @@ class AuthorsDialog(Gtk.Window):
                 lang_iso = lang_dd.lang_iso
             else:
                 lang_iso = "en"
-        position = 0
-        i = 0
-        while i < 999:
-            author = model.get_item(i)
-            if author is None:
-                break
-            if lang_iso == author.lang_iso:
-                position = i
-                break
-            i = i + 1
-
-        return position
+        return self.parent.lang_position(lang_iso)
 
     def set_modified(self, modified: bool = True) -> None:
         if self.is_modified is not modified:
@@ -312,14 +298,7 @@ class AuthorsDialog(Gtk.Window):
 
     def save(self) -> None:
         self.authors.clear()
-        i = 0
-        while i < 1000:
-            row: Author = self.model.get_item(i)
-            if row is None:
-                break
-
-            self.authors.append(row._dict())
-            i = i + 1
+        self.authors.extend(row._dict() for row in self.model)
 
         self.parent.modified()
 
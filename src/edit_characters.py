@@ -132,14 +132,7 @@ class CharacterDialog(Gtk.Window):
     def save_and_exit(self, widget: Gtk.Button) -> None:
         if self.is_modified:
             self.parent.acbf_document.characters.clear()
-            i = 0
-            while i < 9999:
-                char: Character = self.model.get_item(i)
-                if char is None:
-                    break
-                name = char.name
-                self.parent.acbf_document.characters.append(name)
-                i = i + 1
+            self.parent.acbf_document.characters.extend(char.name for char in self.model)
 
             self.parent.char_widget_update()
             self.parent.modified()
@@ -147,16 +147,7 @@ class ContentRatingsDialog(Gtk.Window):
 
     def save(self) -> None:
         self.parent.acbf_document.content_ratings.clear()
-        i = 0
-        while i < 1000:
-            row: Rating = self.model.get_item(i)
-            if row is None:
-                break
-
-            self.parent.acbf_document.content_ratings.append(
-                (row.type, row.name),
-            )
-            i = i + 1
+        self.parent.acbf_document.content_ratings.extend((row.type, row.name) for row in self.model)
 
         self.parent.modified()
 
@@ -22,6 +22,9 @@ from gi.repository import Gtk
 
 gi.require_version("Gtk", "4.0")
 
+# compiled once rather than each time the dialog opens
+_TEXT_LAYER_LANGS = xml.XPath("meta-data/book-info/languages/text-layer/@lang")
+
 
 class ContentItem(GObject.Object):
     title = GObject.Property(type=str)
@@ -41,17 +44,20 @@ class EditContentWindow(Gtk.Window):
 
         self.is_modified: bool = False
         self.previous_lang: int = 0
-        self.page_image_names: list[str] = []
+        # pages don't change while the dialog is open, so their images are listed once for every row and language
+        self.pages: list[xml._Element] = parent.acbf_document.tree.findall("body/page")
+        self.page_image_names: list[str] = [page.find("image").get("href") for page in self.pages]
+        self.page_positions: dict[str, int] = {}
+        for idx, image_name in enumerate(self.page_image_names):
+            self.page_positions.setdefault(image_name, idx)
+        self.page_list = Gtk.StringList.new(self.page_image_names)
 
         self.model: Gio.ListStore = Gio.ListStore(item_type=ContentItem)
         # Text Layers switch
         self.contents_languages: list[str] = []
-        try:
-            for item in parent.acbf_document.tree.findall("meta-data/book-info/languages/text-layer"):
-                if item.get("lang") not in self.contents_languages:
-                    self.contents_languages.append(item.get("lang"))
-        except Exception:
-            pass
+        for lang in _TEXT_LAYER_LANGS(parent.acbf_document.tree):
+            if lang not in self.contents_languages:
+                self.contents_languages.append(lang)
 
         toolbar_header = Gtk.HeaderBar()
         self.set_titlebar(toolbar_header)
@@ -107,10 +113,7 @@ class EditContentWindow(Gtk.Window):
         list_item.set_child(entry)
 
     def setup_page_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
-        pages: list[str] = []
-        for page in self.page_image_names:
-            pages.append(page)
-        entry: Gtk.DropDown = Gtk.DropDown.new_from_strings(pages)
+        entry: Gtk.DropDown = Gtk.DropDown(model=self.page_list)
         list_item.set_child(entry)
 
     def setup_delete_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
@@ -130,9 +133,7 @@ class EditContentWindow(Gtk.Window):
     def bind_page_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
         item = list_item.get_item()
         entry: Gtk.DropDown = list_item.get_child()
-        for i, page in enumerate(self.page_image_names):
-            if page == item.page:
-                entry.set_selected(i)
+        entry.set_selected(self.page_positions.get(item.page, 0))
         entry.connect("notify::selected", self.page_changed, item)
 
     def unbind_page_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
@@ -205,21 +206,19 @@ class EditContentWindow(Gtk.Window):
 
     def save_contents(self, lang: int) -> None:
         for entry in self.model:
-            xml_page = self.parent.acbf_document.tree.xpath(f"//page[image[@href='{entry.page}']]")
-            if len(xml_page) > 0:
-                element = xml.SubElement(xml_page[0], "title")
+            # each entry's page is found through the positions listed when the dialog opened
+            idx = self.page_positions.get(entry.page)
+            if idx is not None:
+                element = xml.SubElement(self.pages[idx], "title")
                 element.set("lang", self.contents_languages[lang])
                 element.text = entry.title
 
     def update_contents(self, lang: int) -> None:
         # TODO show image
-        self.page_image_names.clear()
-        for page in self.parent.acbf_document.tree.findall("body/page"):
-            self.page_image_names.append(page.find("image").get("href"))
-
-        self.model.remove_all()
-
-        for idx, page in enumerate(self.parent.acbf_document.tree.findall("body/page")):
+        # the rows for the language are collected first and replace the old ones in one go,
+        # so the view is updated once rather than for every row
+        items: list[ContentItem] = []
+        for idx, page in enumerate(self.pages):
             default_title = ""
             title_found = False
             for title in page.findall("title"):
@@ -227,7 +226,9 @@ class EditContentWindow(Gtk.Window):
                 if (title.get("lang") == self.contents_languages[lang]) or (
                     title.get("lang") is None and self.contents_languages[lang] == "en"
                 ):
-                    self.add_content_item(None, title.text, self.page_image_names[idx])
+                    items.append(ContentItem(title=title.text, page=self.page_image_names[idx]))
                     title_found = True
             if not title_found and default_title != "":
-                self.add_content_item(None)
+                items.append(ContentItem())
+
+        self.model.splice(0, self.model.get_n_items(), items)
@@ -21,6 +21,9 @@ from gi.repository import Gtk
 
 gi.require_version("Gtk", "4.0")
 
+_DBREF_TYPES = ["", "URL", "IssueID", "SeriesID", "Other"]
+_DBREF_TYPE_INDEX = {dbtype: idx for idx, dbtype in enumerate(_DBREF_TYPES)}
+
 
 class DBRef(GObject.Object):
     dbname = GObject.Property(type=str)
@@ -49,6 +52,8 @@ class DBRefDialog(Gtk.Window):
         self.connect("close-request", self.save_and_exit)
 
         self.model = Gio.ListStore.new(item_type=DBRef)
+        # one list of types shared by every row's dropdown
+        self.dbref_types = Gtk.StringList.new(_DBREF_TYPES)
 
         for ref in self.parent.acbf_document.databaseref:
             self.model.append(DBRef(ref["dbname"], ref["dbtype"], ref["value"]))
@@ -106,7 +111,7 @@ class DBRefDialog(Gtk.Window):
         list_item.set_child(entry)
 
     def setup_type_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
-        entry: Gtk.DropDown = Gtk.DropDown.new_from_strings(["", "URL", "IssueID", "SeriesID", "Other"])
+        entry: Gtk.DropDown = Gtk.DropDown(model=self.dbref_types)
         list_item.set_child(entry)
 
     def setup_delete_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
@@ -126,19 +131,7 @@ class DBRefDialog(Gtk.Window):
     def bind_type_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
         item: DBRef = list_item.get_item()
         entry: Gtk.DropDown = list_item.get_child()
-        dd_model: Gtk.StringList = entry.get_model()
-        position = 0
-        i = 0
-        while i < 999:
-            dbtype = dd_model.get_item(i)
-            if dbtype is None:
-                break
-            if dbtype.get_string() == item.dbtype:
-                position = i
-                break
-            i = i + 1
-
-        entry.set_selected(position)
+        entry.set_selected(_DBREF_TYPE_INDEX.get(item.dbtype, 0))
         entry.connect("notify::selected", self.type_changed, item)
 
     def unbind_type_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
@@ -182,14 +175,7 @@ class DBRefDialog(Gtk.Window):
 
     def save(self) -> None:
         self.parent.acbf_document.databaseref.clear()
-        i = 0
-        while i < 1000:
-            row: DBRef = self.model.get_item(i)
-            if row is None:
-                break
-
-            self.parent.acbf_document.databaseref.append(row._dict())
-            i = i + 1
+        self.parent.acbf_document.databaseref.extend(row._dict() for row in self.model)
 
         self.parent.modified()
 
@@ -60,15 +60,12 @@ class GenresDialog(Gtk.Window):
         self.connect("close-request", self.save_and_exit)
         self.model: Gio.ListStore = Gio.ListStore(item_type=Genre)
 
+        # genre: match of the genres set in the document
+        document_genres: dict[str, int] = dict(self.parent.acbf_document.genres)
         for genre in sorted(constants.GENRES_LIST):
             name: str = genre.replace("_", " ").capitalize()
-            active: bool = False
-            match: int = 0
-            # Get any set values
-            for g in self.parent.acbf_document.genres:
-                if g[0] == genre:
-                    active = True
-                    match = g[1]
+            active: bool = genre in document_genres
+            match: int = document_genres.get(genre, 0)
 
             self.model.append(Genre(name=name, active=active, match=match))
 
@@ -92,7 +89,6 @@ class GenresDialog(Gtk.Window):
         name_factory = Gtk.SignalListItemFactory()
         name_factory.connect("setup", self.setup_name_column)
         name_factory.connect("bind", self.bind_name_column)
-        name_factory.connect("unbind", self.unbind_name_column)
         name_column = Gtk.ColumnViewColumn(title="Genre", factory=name_factory)
         name_column.set_expand(True)
         name_column.set_resizable(True)
@@ -119,6 +115,12 @@ class GenresDialog(Gtk.Window):
         entry.set_margin_start(3)
         list_item.set_child(entry)
 
+        # one controller per cell, the row it toggles is whatever item the cell is bound to
+        click_controller = Gtk.GestureClick()
+        click_controller.set_button(1)
+        click_controller.connect("pressed", self.label_clicked, list_item)
+        entry.add_controller(click_controller)
+
     def setup_match_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
         entry: Gtk.SpinButton = Gtk.SpinButton()
         entry.set_range(0, 100)
@@ -139,28 +141,9 @@ class GenresDialog(Gtk.Window):
 
     def bind_name_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ColumnViewCell) -> None:
         item: Genre = list_item.get_item()
-        position = list_item.get_position()
         entry: Gtk.Label = list_item.get_child()
-        checkbox: Gtk.CheckButton = entry.get_parent().get_prev_sibling().get_first_child()
         entry.set_text(item.name or "")
 
-        click_controller = Gtk.GestureClick()
-        click_controller.set_button(1)
-        click_controller.connect("pressed", self.label_clicked, item, position, checkbox)
-        entry.add_controller(click_controller)
-
-    def unbind_name_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ColumnViewCell) -> None:
-        # TODO Unbind click
-        item: Genre = list_item.get_item()
-        position = list_item.get_position()
-        entry: Gtk.Label = list_item.get_child()
-        checkbox: Gtk.CheckButton = entry.get_parent().get_prev_sibling().get_first_child()
-
-        click_controller = Gtk.GestureClick()
-        click_controller.set_button(1)
-        click_controller.connect("pressed", self.label_clicked, item, position, checkbox)
-        entry.add_controller(click_controller)
-
     def bind_match_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
         item: Genre = list_item.get_item()
         entry: Gtk.SpinButton = list_item.get_child()
@@ -188,20 +171,15 @@ class GenresDialog(Gtk.Window):
         presses: int,
         x: int,
         y: int,
-        item: Genre,
-        position: int,
-        checkbox: Gtk.CheckButton,
+        list_item: Gtk.ColumnViewCell,
     ) -> None:
-        active = True
-        if item.active:
-            active = False
-
-        item.active = active
-        checkbox.set_active(active)
-        found, position = self.model.find(item)
-        if found:
-            self.model.items_changed(position, 0, 0)
-            self.is_modified = True
+        item: Genre | None = list_item.get_item()
+        if item is None:
+            return
+        # Toggle the row itself, re-sorting rebinds the check button from the model
+        item.active = not item.active
+        self.model.sort(sort_genres)
+        self.is_modified = True
 
     def set_modified(self, modified: bool = True) -> None:
         if self.is_modified is not modified:
@@ -213,16 +191,9 @@ class GenresDialog(Gtk.Window):
 
     def save(self) -> None:
         self.parent.acbf_document.genres.clear()
-        i = 0
-        while i < 1000:
-            row: Genre = self.model.get_item(i)
-            if row is None:
-                break
-            if row.active:
-                self.parent.acbf_document.genres.append(
-                    (row.name.lower().replace(" ", "_"), row.match),
-                )
-            i = i + 1
+        self.parent.acbf_document.genres.extend(
+            (row.name.lower().replace(" ", "_"), row.match) for row in self.model if row.active
+        )
 
         self.parent.modified()
 
@@ -129,14 +129,7 @@ class HistoryDialog(Gtk.Window):
     def save_and_exit(self, widget: Gtk.Button) -> None:
         if self.is_modified:
             self.parent.acbf_document.history.clear()
-            i = 0
-            while i < 9999:
-                hist: History = self.model.get_item(i)
-                if hist is None:
-                    break
-                line = hist.history
-                self.parent.acbf_document.history.append(line)
-                i = i + 1
+            self.parent.acbf_document.history.extend(hist.history for hist in self.model)
 
             self.parent.history_widget_update()
             self.parent.modified()
@@ -129,14 +129,7 @@ class KeywordsDialog(Gtk.Window):
     def save_and_exit(self, widget: Gtk.Button) -> None:
         if self.is_modified:
             self.parent.acbf_document.keywords.clear()
-            i = 0
-            while i < 9999:
-                keyword: Keyword = self.model.get_item(i)
-                if keyword is None:
-                    break
-                word = keyword.keyword
-                self.parent.acbf_document.keywords.append(word)
-                i = i + 1
+            self.parent.acbf_document.keywords.extend(keyword.keyword for keyword in self.model)
 
             self.parent.keywords_widget_update()
             self.parent.modified()
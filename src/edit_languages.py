@@ -140,7 +140,7 @@ class LanguageDialog(Gtk.Window):
     def bind_lang_iso_column(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
         item: Language = list_item.get_item()
         entry: Gtk.DropDown = list_item.get_child()
-        position = self.compare_lang(item, entry.get_model())
+        position = self.compare_lang(item)
         entry.set_selected(position)
         entry.connect("notify::selected", self.lang_iso_change, item)
 
@@ -181,23 +181,12 @@ class LanguageDialog(Gtk.Window):
         position = widget.get_selected()
         self.model.items_changed(position, 0, 0)
 
-    def compare_lang(self, item: GObject, model: Gio.ListStore) -> int:
+    def compare_lang(self, item: GObject) -> int:
         lang_iso = item.lang_iso
         if lang_iso is None:
             # Use currently set language
             lang_iso = self.parent.lang_button.get_selected_item().lang_iso
-        position: int = 0
-        i = 0
-        while i < 999:
-            lang = model.get_item(i)
-            if lang is None:
-                break
-            if lang_iso == lang.lang_iso:
-                position = i
-                break
-            i = i + 1
-
-        return position
+        return self.parent.lang_position(lang_iso)
 
     def set_modified(self, modified: bool = True) -> None:
         if self.is_modified is not modified:
@@ -209,17 +198,14 @@ class LanguageDialog(Gtk.Window):
 
     def save_and_exit(self, widget: Gtk.Button) -> None:
         if self.is_modified:
-            self.parent.acbf_document.languages.clear()
-            i = 0
-            while i < 9999:
-                lang: Language = self.model.get_item(i)
-                if lang is None:
-                    break
-
-                self.parent.acbf_document.languages.append(
-                    (lang.lang_iso, lang.show),
-                )
-                i = i + 1
+            document = self.parent.acbf_document
+            old_langs = {lang_iso for lang_iso, _show in document.languages}
+            document.languages.clear()
+            document.languages.extend((lang.lang_iso, lang.show) for lang in self.model)
+            # titles and annotations of the languages taken out go with them
+            for lang_iso in old_langs.difference(lang_iso for lang_iso, _show in document.languages):
+                document.book_title.pop(lang_iso, None)
+                document.annotation.pop(lang_iso, None)
 
             self.parent.lang_widget_update()
             self.parent.modified()
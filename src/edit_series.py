@@ -170,16 +170,7 @@ class SeriesDialog(Gtk.Window):
 
     def save(self) -> None:
         self.parent.acbf_document.sequences.clear()
-        i = 0
-        while i < 1000:
-            row: Series = self.model.get_item(i)
-            if row is None:
-                break
-
-            self.parent.acbf_document.sequences.append(
-                (row.name, row.volume, row.number),
-            )
-            i = i + 1
+        self.parent.acbf_document.sequences.extend((row.name, row.volume, row.number) for row in self.model)
 
         self.parent.modified()
 
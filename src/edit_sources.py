@@ -129,14 +129,7 @@ class SourcesDialog(Gtk.Window):
     def save_and_exit(self, widget: Gtk.Button) -> None:
         if self.is_modified:
             self.parent.acbf_document.sources.clear()
-            i = 0
-            while i < 9999:
-                source: Source = self.model.get_item(i)
-                if source is None:
-                    break
-                s = source.source
-                self.parent.acbf_document.sources.append(s)
-                i = i + 1
+            self.parent.acbf_document.sources.extend(source.source for source in self.model)
 
             self.parent.sources_widget_update()
             self.parent.modified()
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import pathlib
 
+import constants
 import fontselectiondialog
 import gi
 from gi.repository import Gdk
@@ -54,50 +55,62 @@ class EditStylesWindow(Gtk.Window):
         self.set_titlebar(toolbar_header)
 
         self.model: Gio.ListStore = Gio.ListStore(item_type=FontItem)
-
+        # one colour chooser for every row's button, and each colour parsed once
+        self.colour_dialog = Gtk.ColorDialog()
+        self.colours: dict[str, Gdk.RGBA] = {}
+
+        # names were read when the fonts were listed, bundled fonts take precedence over system ones
+        fonts_by_path: dict[str, dict[str, str]] = {
+            font_info["path"]: font_info
+            for fonts in (constants.get_system_fonts(), self.parent.acbf_document.custom_fonts)
+            for font_info in fonts.values()
+        }
+        # most styles share a font, so each font's labels are worked out once
+        font_labels: dict[str, tuple[str, str]] = {}  # path: display name, file name
+        font_items: list[FontItem] = []
         for k, v in self.parent.acbf_document.font_styles.items():
-            font_path = pathlib.Path(v)
-            font = ImageFont.truetype(font_path)
-            font_name = font.getname()
-            font_name = f"{font_name[0]} ({font_name[1]})"
-            # font = font_path.stem.split("-")[0]
-            font_familes = self.parent.acbf_document.font_families[k]
-            colour = self.parent.acbf_document.font_colors.get(k, "#000000")
-            self.model.append(
+            labels = font_labels.get(v)
+            if labels is None:
+                font_path = pathlib.Path(v)
+                font_info = fonts_by_path.get(v)
+                if font_info is not None:
+                    font_name = f"{font_info['name']} ({font_info['subfamily']})"
+                else:
+                    pil_font_name = ImageFont.truetype(font_path).getname()
+                    font_name = f"{pil_font_name[0]} ({pil_font_name[1]})"
+                labels = font_labels[v] = (font_name, font_path.stem)
+            font_items.append(
                 FontItem(
                     sematic=k,
-                    font=font_name,
-                    font_filename=font_path.stem.split("/")[0],
-                    font_families=font_familes,
-                    colour=colour,
+                    font=labels[0],
+                    font_filename=labels[1],
+                    font_families=self.parent.acbf_document.font_families[k],
+                    # the colour of normal text is the speech colour, see set_font_color
+                    colour=self.parent.acbf_document.font_colors.get("speech" if k == "normal" else k, "#000000"),
                     path=v,
                 ),
             )
+        self.model.splice(0, 0, font_items)
 
         selection_model = Gtk.NoSelection(model=self.model)
 
         column_view = Gtk.ColumnView(model=selection_model)
 
-        sematic_factory = Gtk.SignalListItemFactory()
-        sematic_factory.connect("setup", self.setup_sematic_column)
-        sematic_factory.connect("bind", self.bind_sematic_column)
-        sematic_column = Gtk.ColumnViewColumn(title="Title", factory=sematic_factory)
-        sematic_column.set_resizable(True)
-        column_view.append_column(sematic_column)
-
-        font_factory = Gtk.SignalListItemFactory()
-        font_factory.connect("setup", self.setup_font_column)
-        font_factory.connect("bind", self.bind_font_column)
-        font_factory = Gtk.ColumnViewColumn(title="Font", factory=font_factory)
-        font_factory.set_resizable(True)
-        font_factory.set_expand(True)
-        column_view.append_column(font_factory)
-
-        colour_factory = Gtk.SignalListItemFactory()
-        colour_factory.connect("setup", self.setup_colour_column)
-        colour_factory.connect("bind", self.bind_colour_column)
-        colour_factory = Gtk.ColumnViewColumn(title="Colour", factory=colour_factory)
-        column_view.append_column(colour_factory)
+        # title, setup, bind and unbind handlers, resizable, expand
+        columns = (
+            ("Title", self.setup_sematic_column, self.bind_sematic_column, None, True, False),
+            ("Font", self.setup_font_column, self.bind_font_column, self.unbind_font_column, True, True),
+            ("Colour", self.setup_colour_column, self.bind_colour_column, self.unbind_colour_column, False, False),
+        )
+        for title, setup, bind, unbind, resizable, expand in columns:
+            factory = Gtk.SignalListItemFactory()
+            factory.connect("setup", setup)
+            factory.connect("bind", bind)
+            if unbind is not None:
+                # rows are recycled, so the handlers connected in bind must go again
+                factory.connect("unbind", unbind)
+            column = Gtk.ColumnViewColumn(title=title, factory=factory, resizable=resizable, expand=expand)
+            column_view.append_column(column)
 
         scrolled_window = Gtk.ScrolledWindow()
         scrolled_window.set_child(column_view)
@@ -118,7 +131,7 @@ class EditStylesWindow(Gtk.Window):
         list_item.set_child(entry)
 
     def setup_colour_column(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
-        button = Gtk.ColorDialogButton.new(Gtk.ColorDialog())
+        button = Gtk.ColorDialogButton.new(self.colour_dialog)
         list_item.set_child(button)
 
     def bind_sematic_column(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
@@ -139,8 +152,10 @@ class EditStylesWindow(Gtk.Window):
     def bind_colour_column(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
         item = list_item.get_item()
         button = list_item.get_child()
-        colour = Gdk.RGBA()
-        colour.parse(item.colour)
+        colour = self.colours.get(item.colour)
+        if colour is None:
+            colour = self.colours[item.colour] = Gdk.RGBA()
+            colour.parse(item.colour)
         button.set_rgba(colour)
         button.connect("notify::rgba", self.set_font_color, item)
 
@@ -149,7 +164,7 @@ class EditStylesWindow(Gtk.Window):
         entry.disconnect_by_func(self.set_font_color)
 
     def font_button_click(self, widget: Gtk.Button, item: FontItem) -> None:
-        chooser = fontselectiondialog.FontSelectionOldDialog(self, self.parent.acbf_document.fonts_dir, item)
+        chooser = fontselectiondialog.FontSelectionOldDialog(self, self.parent.acbf_document.custom_fonts, item)
         chooser.present()
 
     def set_font_color(self, widget: Gtk.ColorDialogButton, _pspec: GObject.GParamSpec, item: FontItem) -> None:
@@ -157,7 +172,12 @@ class EditStylesWindow(Gtk.Window):
         if font_type == "normal":
             font_type = "speech"
 
-        self.parent.acbf_document.font_colors[font_type] = widget.get_rgba().to_string()
+        colour = widget.get_rgba().to_string()
+        if colour == item.colour:
+            return
+        item.colour = colour
+        self.parent.acbf_document.font_colors[font_type] = colour
+        self.parent.acbf_document.modified_styles.add(item.sematic)
         self.set_modified()
 
     def set_modified(self, modified: bool = True) -> None:
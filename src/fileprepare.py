@@ -34,6 +34,8 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp")
+
 
 class FilePrepare:
     def __init__(self, window: Gtk.Window, filename: str, tempdir: str, show_dialog: bool):
@@ -45,7 +47,7 @@ class FilePrepare:
 
         if zipfile.is_zipfile(filename):
             file_type = "ZIP"
-        elif filename[-3:].upper() == "CBR":
+        elif filename.upper().endswith("CBR"):
             file_type = "RAR"
 
         if file_type is not None:
@@ -58,11 +60,8 @@ class FilePrepare:
                 progress_dialog.show()
 
             # clear temp directory
-            for root, dirs, files in os.walk(tempdir):
-                for f in files:
-                    os.unlink(os.path.join(root, f))
-                for d in dirs:
-                    shutil.rmtree(os.path.join(root, d))
+            shutil.rmtree(tempdir, ignore_errors=True)
+            os.makedirs(tempdir, 0o700, exist_ok=True)
 
             # extract files from CBZ into DATA_DIR
             if file_type == "ZIP":
@@ -87,7 +86,7 @@ class FilePrepare:
             acbf_found: bool = False
             for datafile in os.listdir(tempdir):
                 self.file_list.append(Path(datafile))
-                if datafile[-4:] == "acbf":
+                if datafile.endswith("acbf"):
                     acbf_found = True
                     return_filename = os.path.join(tempdir, datafile)
 
@@ -115,14 +114,7 @@ class FilePrepare:
                             os.path.join(root, f)[len(tempdir) + 1 :],
                         )
                 for datafile in sorted(all_files):
-                    if datafile[-4:].upper() in (
-                        ".JPG",
-                        ".PNG",
-                        ".GIF",
-                        "WEBP",
-                        ".BMP",
-                        "JPEG",
-                    ):
+                    if datafile.lower().endswith(IMAGE_EXTENSIONS):
                         if cover_image == "":
                             # insert coverpage
                             cover_image = xml.SubElement(coverpage, "image", href=datafile)
@@ -192,22 +184,14 @@ class FilePrepare:
                     ]:
                         if comicinfo_tree.find(author) is not None:
                             author_element = xml.SubElement(bookinfo, "author", activity=author)
+                            name_parts = comicinfo_tree.find(author).text.split(" ")
                             first_name = xml.SubElement(author_element, "first-name")
-                            first_name.text = comicinfo_tree.find(author).text.split(" ")[0]
-                            if len(comicinfo_tree.find(author).text.split(" ")) > 2:
+                            first_name.text = name_parts[0]
+                            if len(name_parts) > 2:
                                 middle_name = xml.SubElement(author_element, "middle-name")
-                                middle_name.text = ""
-                                for i in range(len(comicinfo_tree.find(author).text.split(" "))):
-                                    if i > 0 and i < (len(comicinfo_tree.find(author).text.split(" ")) - 1):
-                                        middle_name.text = (
-                                            middle_name.text
-                                            + " "
-                                            + comicinfo_tree.find(
-                                                author,
-                                            ).text.split(" ")[i]
-                                        )
+                                middle_name.text = "".join(" " + part for part in name_parts[1:-1])
                             last_name = xml.SubElement(author_element, "last-name")
-                            last_name.text = comicinfo_tree.find(author).text.split(" ")[-1]
+                            last_name.text = name_parts[-1]
 
                     if comicinfo_tree.find("Title") is not None:
                         book_title = xml.SubElement(bookinfo, "book-title")
@@ -269,8 +253,7 @@ class FilePrepare:
                 # save generated acbf file
                 progress_bar.set_fraction(1)
                 return_filename = os.path.join(tempdir, os.path.splitext(os.path.basename(filename))[0] + ".acbf")
-                with open(return_filename, "w") as file:
-                    file.write(xml.tostring(tree, encoding="Unicode", pretty_print=True))
+                xml.ElementTree(tree).write(return_filename, encoding="utf-8", pretty_print=True)
 
             self.filename = return_filename
             progress_dialog.close()
@@ -53,11 +53,10 @@ class FontSelectionOldDialog(Gtk.Window):
     """Font Selection dialog."""
 
     # TODO Integrate system font picker (somehow)
-    def __init__(self, parent: Gtk.Window, font_dir: str, selected_font: Any):
+    def __init__(self, parent: Gtk.Window, fonts: dict[str, dict[str, str]], selected_font: Any):
         super().__init__(title="Font Selection (comic 'Fonts' directory)")
         self.set_transient_for(parent)
         self.parent = parent
-        self.font_directory = font_dir
         self.selected_font = selected_font
         self.selected_item: int = -1
         self.set_default_size(350, 400)
@@ -99,38 +98,25 @@ class FontSelectionOldDialog(Gtk.Window):
         font_view.set_single_click_activate(True)
         font_view.connect("activate", self.tree_item_selected)
 
-        for font_file in os.listdir(self.font_directory):
-            if font_file.lower().endswith(".ttf") or font_file.lower().endswith(".otf"):
-                try:
-                    font_path = os.path.join(self.font_directory, font_file)
-                    font = ImageFont.truetype(font_path)
-                    label = font.getname()
-                    self.treestore.append(
-                        FontFileItem(
-                            label=label[0],
-                            style=label[1],
-                            name=font_file,
-                            path=font_path,
-                        ),
-                    )
-                except OSError as e:
-                    logging.error(f"Failed to read font file: {font_file} error: {e}")
-                except Exception as e:
-                    logging.error(f"Failed to load font file: {font_file} error: {e}")
+        # The comic's fonts were already read when the document was loaded
+        selected_position = -1
+        for position, font_info in enumerate(sorted(fonts.values(), key=lambda f: f["path"])):
+            if font_info["path"] == selected_font.path:
+                selected_position = position
+            self.treestore.append(
+                FontFileItem(
+                    label=font_info["name"],
+                    style=font_info["subfamily"],
+                    name=os.path.basename(font_info["path"]),
+                    path=font_info["path"],
+                ),
+            )
 
         sw.set_child(font_view)
 
-        # Find current font in list and select
-        i = 0
-        while i < 999:
-            font_item: FontFileItem = self.treestore.get_item(i)
-            if font_item is None:
-                break
-
-            if font_item.path == selected_font.path:
-                font_view.scroll_to(i, Gtk.ListScrollFlags.SELECT)
-                break
-            i = i + 1
+        # Select current font
+        if selected_position > -1:
+            font_view.scroll_to(selected_position, Gtk.ListScrollFlags.SELECT)
 
         self.set_child(content)
 
@@ -168,14 +154,15 @@ class FontSelectionOldDialog(Gtk.Window):
     def okay_clicked(self, widget: Gtk.Button) -> None:
         if self.selected_item > -1:
             font: FontFileItem = self.treestore.get_item(self.selected_item)
-            self.parent.parent.acbf_document.font_styles[self.selected_font.sematic] = font.path
-            model: Gio.ListStore = self.parent.model
-            found, position = model.find(self.selected_font)
-            if found:
-                item = model.get_item(position)
+            if font.path != self.selected_font.path:
+                self.parent.parent.acbf_document.font_styles[self.selected_font.sematic] = font.path
+                self.parent.parent.acbf_document.modified_styles.add(self.selected_font.sematic)
+                # the styles window passed in its own row, so it can be updated without searching its model
                 # TODO Keep fallback and only replace first item rather than acbfdocument.savetree?
-                item.font = font.label
-            self.parent.set_modified()
+                self.selected_font.font = f"{font.label} ({font.style})"
+                self.selected_font.font_filename = os.path.splitext(font.name)[0]
+                self.selected_font.path = font.path
+                self.parent.set_modified()
         self.close()
 
     def cancel_clicked(self, widget: Gtk.Button) -> None:
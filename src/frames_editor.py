@@ -32,6 +32,7 @@ import text_layer
 import detection
 from gi.repository import Gdk
 from gi.repository import Gio
+from gi.repository import GLib
 from gi.repository import GObject
 from gi.repository import Gtk
 from gi.repository import PangoCairo
@@ -46,6 +47,19 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+_TEXT_AREA_TYPES = [
+    "Speech",
+    "Commentary",
+    "Formal",
+    "Letter",
+    "Code",
+    "Heading",
+    "Audio",
+    "Thought",
+    "Sign",
+]
+_TEXT_AREA_TYPE_INDEX = {text_type: idx for idx, text_type in enumerate(_TEXT_AREA_TYPES)}
+
 
 class ListItem(GObject.Object):
     __gtype_name__ = "ListItem"
@@ -247,6 +261,8 @@ class FramesEditorDialog(Gtk.Window):
         texts_colour_column = Gtk.ColumnViewColumn(title="Colour", factory=texts_colour_factory)
         texts_column_view.append_column(texts_colour_column)
 
+        # one list of types shared by every row's dropdown
+        self.text_area_types = Gtk.StringList.new(_TEXT_AREA_TYPES)
         texts_type_factory = Gtk.SignalListItemFactory()
         texts_type_factory.connect("setup", self.setup_type_column)
         texts_type_factory.connect("bind", self.bind_type_column)
@@ -332,7 +348,7 @@ class FramesEditorDialog(Gtk.Window):
         sw = Gtk.ScrolledWindow()
         sw.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
 
-        self.general_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        self.general_box = Gtk.Grid(column_spacing=5)
         self.transition_dropdown: Gtk.DropDown = Gtk.DropDown.new_from_strings(
             list(self.transition_dropdown_dict.values()),
         )
@@ -793,28 +809,14 @@ class FramesEditorDialog(Gtk.Window):
 
     def load_general(self) -> None:
         # main bg_color
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-
-        label = Gtk.Label()
-        label.set_markup("Main Background Color: ")
-        hbox.append(label)
-
         color = Gdk.RGBA()
         color.parse(self.parent.acbf_document.bg_color)
 
         color_button = Gtk.ColorDialogButton.new(Gtk.ColorDialog())
         color_button.set_rgba(color)
         color_button.connect("notify::rgba", self.set_body_bgcolor)
-        hbox.append(color_button)
-        self.general_box.append(hbox)
 
         # page bg_color
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-
-        label = Gtk.Label()
-        label.set_markup("Page Background Color: ")
-        hbox.append(label)
-
         color = Gdk.RGBA()
         try:
             color.parse(self.selected_page_bgcolor)
@@ -823,21 +825,22 @@ class FramesEditorDialog(Gtk.Window):
         self.page_color_button = Gtk.ColorDialogButton.new(Gtk.ColorDialog())
         self.page_color_button.set_rgba(color)
         self.page_color_button.connect("notify::rgba", self.set_page_bgcolor)
-        hbox.append(self.page_color_button)
-        self.general_box.append(hbox)
 
         # transition
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-
-        label = Gtk.Label()
-        label.set_markup("Page Transition: ")
-        hbox.append(label)
-
         # self.transition_dropdown.connect("notify::selected", self.page_transition_changed)
-
-        hbox.append(self.transition_dropdown)
         self.update_page_transition()
-        self.general_box.append(hbox)
+
+        # one grid lays out all rows instead of a box per row
+        rows: list[tuple[str, Gtk.Widget]] = [
+            ("Main Background Color:", color_button),
+            ("Page Background Color:", self.page_color_button),
+            ("Page Transition:", self.transition_dropdown),
+        ]
+        for row, (label_text, widget) in enumerate(rows):
+            # plain text, no markup to parse; the grid spacing replaces the padding spaces
+            label = Gtk.Label(label=label_text, xalign=0)
+            self.general_box.attach(label, 0, row, 1, 1)
+            self.general_box.attach(widget, 1, row, 1, 1)
 
     def update_page_transition(self) -> None:
         current_trans = self.parent.acbf_document.get_page_transition(
@@ -1588,18 +1591,7 @@ class FramesEditorDialog(Gtk.Window):
 
     def setup_type_column(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ColumnViewCell) -> None:
         # entry = Gtk.Label()
-        text_area_types = [
-            "Speech",
-            "Commentary",
-            "Formal",
-            "Letter",
-            "Code",
-            "Heading",
-            "Audio",
-            "Thought",
-            "Sign",
-        ]
-        entry: Gtk.DropDown = Gtk.DropDown.new_from_strings(text_area_types)
+        entry: Gtk.DropDown = Gtk.DropDown(model=self.text_area_types)
         entry.set_tooltip_text("Text Area Type")
         list_item.set_child(entry)
 
@@ -1674,21 +1666,7 @@ class FramesEditorDialog(Gtk.Window):
     def bind_type_column(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ColumnViewCell) -> None:
         item: TextLayerItem = list_item.get_item()
         entry: Gtk.DropDown = list_item.get_child()
-        position: int = 0
-        model = entry.get_model()
-        i = 0
-        while i < 999:
-            row = model.get_item(i)
-            if row is None:
-                break
-
-            if item.type.capitalize() == row.get_string():
-                position = i
-                break
-
-            i += 1
-
-        entry.set_selected(position)
+        entry.set_selected(_TEXT_AREA_TYPE_INDEX.get(item.type.capitalize(), 0))
 
         entry.connect("notify::selected", self.type_changed, item)
 
@@ -1797,6 +1775,7 @@ class TextBoxDialog(Gtk.Window):
 
         text_layer: TextLayerItem = self.parent.text_layer_model.get_item(position)
         self.is_modified: bool = False
+        self.text_update_id: int = 0
 
         self.set_size_request(600, 380)
 
@@ -1841,6 +1820,7 @@ class TextBoxDialog(Gtk.Window):
         text_box.set_wrap_mode(Gtk.WrapMode.WORD)
         text_box.get_buffer().set_text(text_layer.text)
         text_box.get_buffer().connect("changed", self.text_text_change, text_layer)
+        self.text_box = text_box
 
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
@@ -2156,14 +2136,21 @@ class TextBoxDialog(Gtk.Window):
         self.is_modified = True
 
     def text_text_change(self, widget: Gtk.TextBuffer, text_item: TextLayerItem) -> None:
-        text = widget.get_text(
-            widget.get_bounds()[0],
-            widget.get_bounds()[1],
-            False,
-        )
-        text_item.set_property("text", text)
         self.is_modified = True
+        # The item's text is bound to its row in the editor, copy it once queued key presses are handled
+        if self.text_update_id == 0:
+            self.text_update_id = GLib.idle_add(self.set_item_text, widget, text_item)
+
+    def set_item_text(self, buffer: Gtk.TextBuffer, text_item: TextLayerItem) -> bool:
+        self.text_update_id = 0
+        start, end = buffer.get_bounds()
+        text_item.set_property("text", buffer.get_text(start, end, False))
+        return False
 
     def exit(self, widget: Gtk.Button, position: int) -> None:
+        if self.text_update_id != 0:
+            # the last edit hasn't been copied yet
+            GLib.source_remove(self.text_update_id)
+            self.set_item_text(self.text_box.get_buffer(), self.parent.text_layer_model.get_item(position))
         if self.is_modified:
             self.parent.text_layer_model.items_changed(position, 0, 0)
@@ -19,6 +19,10 @@ https://github.com/GeoRW/ACBF-Editor
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import datetime
+import functools
 import io
 import logging
 import os
@@ -26,7 +30,6 @@ import re
 import shutil
 import zipfile
 import tempfile
-from copy import deepcopy
 from typing import Any
 from typing import Callable, TYPE_CHECKING
 from xml.sax.saxutils import unescape
@@ -50,10 +53,11 @@ import filechooser
 import fileprepare
 import frames_editor
 import pycountry
-import lxml.etree as xml
+import numpy
 import preferences
 import prefsdialog
 import text_layer as tl
+import utils
 from edit_languages import Language
 from gi.repository import Gdk
 from gi.repository import GdkPixbuf
@@ -62,14 +66,168 @@ from gi.repository import GLib
 from gi.repository import GObject
 from gi.repository import Gtk
 from PIL import Image
+from PIL import ImageOps
+
+try:
+    import pyvips
+except (ImportError, OSError):
+    # OSError: pyvips is installed but libvips itself can't be loaded
+    pyvips = None
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import lxml.etree as xml
+
 
 logger = logging.getLogger("acbf_editor")
 logger.setLevel(logging.DEBUG)
 
+# x,y pairs of a frame or text-area "points" attribute
+_POINT_RE = re.compile(r"(-?\d+),(-?\d+)")
+
+# --resize value, [width]x[height] followed by > (shrink) or < (enlarge)
+_GEOMETRY_RE = re.compile(r"^(\d+)x(\d+)([<>])$")
+
+# Pillow resampling filters for the command line resize filters
+_RESIZE_FILTERS = {
+    "NEAREST": Image.Resampling.NEAREST,
+    "BILINEAR": Image.Resampling.BILINEAR,
+    "BICUBIC": Image.Resampling.BICUBIC,
+    "ANTIALIAS": Image.Resampling.LANCZOS,
+}
+# libvips equivalents of the command line resize filters
+_VIPS_KERNELS = {
+    "NEAREST": "nearest",
+    "BILINEAR": "linear",
+    "BICUBIC": "cubic",
+    "ANTIALIAS": "lanczos3",
+}
+# libvips savers that take a Q (quality) option
+_VIPS_QUALITY_SUFFIXES = (".jpg", ".jpeg", ".webp", ".avif", ".heic", ".heif", ".jxl", ".tif", ".tiff")
+
+
+def _parse_points(points: str) -> list[tuple[str, str]]:
+    """The x,y pairs of a "points" attribute, raising ValueError if any of them is malformed."""
+    pairs: list[tuple[str, str]] = []
+    for token in points.split():
+        match = _POINT_RE.fullmatch(token)
+        if match is None:
+            raise ValueError(f"Malformed points attribute: {points!r}")
+        pairs.append((match[1], match[2]))
+    return pairs
+
+
+@functools.cache
+def _language_info(alpha_2: str) -> Any:
+    # pycountry lookups scan the whole language table
+    return pycountry.languages.get(alpha_2=alpha_2)
+
+
+@functools.lru_cache(maxsize=64)
+def _unescaped(text: str) -> str:
+    # switching languages unescapes the same titles and annotations over and over
+    return unescape(text)
+
+
+def _author_names(authors: list[dict[str, str]]) -> str:
+    """Comma separated "first last" names, falling back to the nickname."""
+    return ", ".join(
+        author["first_name"] + " " + author.get("last_name", "") if author.get("first_name") else author["nickname"]
+        for author in authors
+        if author.get("first_name") or author.get("nickname")
+    )
+
+
+def _calendar_date(text: str) -> GLib.DateTime:
+    """Date for a calendar from a YYYY-MM-DD entry, today if the entry holds anything else."""
+    try:
+        date = datetime.datetime.strptime(text, "%Y-%m-%d")
+    except ValueError:
+        logger.warning("Failed to parse date: %s", text)
+        return GLib.DateTime.new_now_local()
+    return GLib.DateTime.new_local(date.year, date.month, date.day, 0, 0, 0)
+
+
+def _scale_page_points(page: xml._Element, num: int, den: int) -> None:
+    """Scale the points of every frame and text-area on a page by num/den, rounding half up."""
+    elements = list(page.iter("frame", "text-area"))
+    point_lists = [_parse_points(element.get("points")) for element in elements]
+    # all points of the page are scaled in one array operation
+    coords = numpy.array([xy for points in point_lists for xy in points], dtype=numpy.int64).reshape(-1, 2)
+    coords = (coords * num + den // 2) // den
+    ends = numpy.cumsum([len(points) for points in point_lists])
+    for element, scaled in zip(elements, numpy.split(coords, ends[:-1])):
+        element.set("points", " ".join(f"{x},{y}" for x, y in scaled.tolist()))
+
+
+def _save_options(im_format: str, quality: int | None) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Pillow and libvips save options for pages written as im_format."""
+    ext = "." + im_format.lower()
+    # Pillow encodes into memory, so it can't pick the format from the file name
+    pil_options: dict[str, Any] = {"format": Image.registered_extensions().get(ext)}
+    vips_options: dict[str, Any] = {}
+    if quality is not None:
+        pil_options["quality"] = quality
+        if ext in _VIPS_QUALITY_SUFFIXES:
+            vips_options["Q"] = quality
+    if ext in (".jpg", ".jpeg"):
+        # optimised Huffman tables and progressive scans make smaller files at the same quality
+        pil_options.update(optimize=True, progressive=True)
+        vips_options.update(optimize_coding=True, interlace=True)
+    elif ext == ".webp" and quality is not None:
+        pil_options["method"] = 6
+        vips_options["effort"] = 6
+    return pil_options, vips_options
+
+
+def _convert_page(
+    im: Any,
+    out_path: str,
+    save_options: tuple[dict[str, Any], dict[str, Any]],
+    scale: tuple[int, int] | None,
+    resample: Image.Resampling,
+    kernel: str,
+) -> None:
+    """Decode, resize by scale (num, den) and encode a page image (PIL or libvips).
+
+    Runs in a worker thread; PIL and libvips release the GIL while working on pixels.
+    """
+    # the page is written next to the output and renamed over it, so a failed save never leaves half a page
+    root, ext = os.path.splitext(out_path)
+    part_path = f"{root}.part{ext}"
+    if isinstance(im, Image.Image):
+        size: tuple[int, int] | None = None
+        if scale is not None:
+            num, den = scale
+            size = (im.width * num // den, im.height * num // den)
+            # a JPEG not yet decoded is read at 1/2, 1/4 or 1/8 scale when that still covers size
+            im.draft("RGB", size)
+        if im.mode != "RGB":
+            im = im.convert("RGB")
+        if size is not None and im.size != size:
+            im = im.resize(size, resample)
+        # encoded in memory and written with a single write call
+        buffer = io.BytesIO()
+        im.save(buffer, **save_options[0])
+        with open(part_path, "wb") as f:
+            f.write(buffer.getbuffer())
+    else:
+        if scale is not None:
+            im = im.resize(scale[0] / scale[1], kernel=kernel)
+        # libvips streams from the source while it writes
+        im.write_to_file(part_path, **save_options[1])
+    os.replace(part_path, out_path)
+
+
+def _finish_conversion(conversion: concurrent.futures.Future[None], im: Any) -> None:
+    """Wait for a page conversion, re-raising its error, and close the source image."""
+    try:
+        conversion.result()
+    finally:
+        if isinstance(im, Image.Image):
+            im.close()
+
 
 class MainWindow(Gtk.ApplicationWindow):
     """The ACBF main window"""
@@ -87,6 +245,13 @@ class MainWindow(Gtk.ApplicationWindow):
         self._window = self
         self.font_idx = 0
         self.is_modified: bool = False
+        # set while the forms are filled in from the document
+        self.suspend_modified: bool = False
+        self.cover_update_id: int = 0
+        # the current cover rendered at each (width, height) in device pixels
+        self.cover_textures: dict[tuple[int, int], Gdk.Texture] = {}
+        self.about_logo: Gdk.Texture | None = None
+        self.fallback_pixbuf: GdkPixbuf.Pixbuf | None = None
         self.filename_before: str = ""
         self.original_filename: str
         self.original_file_size: float = 1
@@ -117,82 +282,31 @@ class MainWindow(Gtk.ApplicationWindow):
         self.is_cmd_line = False
         if output_file is not None:
             self.is_cmd_line = True
-            convert_format: str | None = None
-            convert_quality: int | None = None
-            resize_geometry: str | None = None
-            resize_filter: str | None = None
-            text_layer: int | None = None
+            # option -> (conversion setting, method validating and parsing the value)
+            option_handlers: dict[str, tuple[str, Callable[[str], Any]]] = {
+                "-f": ("format", self.cmd_format),
+                "--format": ("format", self.cmd_format),
+                "-q": ("quality", self.cmd_quality),
+                "--quality": ("quality", self.cmd_quality),
+                "-r": ("geometry", self.cmd_resize),
+                "--resize": ("geometry", self.cmd_resize),
+                "-l": ("filter", self.cmd_filter),
+                "--filter": ("filter", self.cmd_filter),
+                "-t": ("text_layer", self.cmd_text_layer),
+                "--text_layer": ("text_layer", self.cmd_text_layer),
+            }
+            conversion: dict[str, Any] = dict.fromkeys(("format", "quality", "geometry", "filter", "text_layer"))
             for opt, value in cmd_options:
-                if opt in ("-f", "--format"):
-                    formats_supported = ("JPG", "PNG", "GIF", "WEBP", "BMP")
-                    if value.upper() not in formats_supported:
-                        print(
-                            "Error: Unrecognized image format:",
-                            value
-                            + ". Use one of following: "
-                            + str(formats_supported)
-                            .replace(
-                                "(",
-                                "",
-                            )
-                            .replace(")", "")
-                            .replace("'", ""),
-                        )
-                        self.exit_program()
-                    else:
-                        convert_format = value
-                if opt in ("-q", "--quality"):
-                    try:
-                        if int(value) > 0 and int(value) < 101:
-                            convert_quality = int(value)
-                        else:
-                            raise ValueError("Image quality must be an integer between 0 and 100.")
-                    except Exception:
-                        print("")
-                        print("Error: Image quality must be an integer between 0 and 100.")
-                        self.exit_program()
-                if opt in ("-r", "--resize"):
-                    if re.match("[0-9]*x[0-9]*[<>]", value) is not None:
-                        resize_geometry = value
-                    else:
-                        print("")
-                        print("Error: Image geometry must be in format [width]x[height][flag].")
-                        print("[width] and [height] defines target image size as integer.")
-                        print("[flag] defines wheather to shrink (>) or enlarge (<) target image.")
-                        self.exit_program()
-                if opt in ("-l", "--filter"):
-                    if value.upper() not in (
-                        "NEAREST",
-                        "BILINEAR",
-                        "BICUBIC",
-                        "ANTIALIAS",
-                    ):
-                        print(
-                            "Error: Unrecognized resize filter:",
-                            value + ". Use one of following: NEAREST, BILINEAR, BICUBIC, ANTIALIAS.",
-                        )
-                        self.exit_program()
-                    else:
-                        resize_filter = value
-                if opt in ("-t", "--text_layer"):
-                    lang_found = False
-                    for i, lang in enumerate(self.acbf_document.languages):
-                        if lang[0] == value and lang[1]:
-                            # for idx, lang in enumerate(self.acbf_document.languages):
-                            # if lang[0] == value and lang[1] == 'TRUE':
-                            lang_found = True
-                            text_layer = i
-                        if not lang_found:
-                            logger.error(
-                                "Error: Language layer",
-                                value,
-                                "is not defined in comic book.",
-                            )
-                            self.exit_program()
-                        else:
-                            for item in self.acbf_document.tree.findall("meta-data/book-info/languages/text-layer"):
-                                if item.get("show") == "False":
-                                    item.attrib["lang"] = value
+                handler = option_handlers.get(opt)
+                if handler is not None:
+                    setting, parse = handler
+                    conversion[setting] = parse(value)
+
+            convert_format: str | None = conversion["format"]
+            convert_quality: int | None = conversion["quality"]
+            resize_geometry: tuple[int, int, str] | None = conversion["geometry"]
+            resize_filter: str | None = conversion["filter"]
+            text_layer: int | None = conversion["text_layer"]
 
             if convert_format is not None or resize_geometry is not None or text_layer is not None:
                 self.convert_images(
@@ -205,11 +319,9 @@ class MainWindow(Gtk.ApplicationWindow):
             self.write_file(output_file)
             self.exit_program()
 
-        # Create a store for dropdown use for all languages
-        self.all_langs: Gio.ListStore = Gio.ListStore.new(Language)
-        for iso_lang in pycountry.languages:
-            if hasattr(iso_lang, "alpha_2"):
-                self.all_langs.append(Language(lang_iso=iso_lang.alpha_2, lang=iso_lang.name))
+        # Store for dropdown use for all languages, filled in by all_langs when a dialog first needs it
+        self.iso_lang_store: Gio.ListStore | None = None
+        self.iso_lang_positions: dict[str, int] = {}  # lang_iso: position in iso_lang_store
 
         self.all_lang_store: Gio.ListStore = Gio.ListStore.new(Language)
 
@@ -352,6 +464,7 @@ class MainWindow(Gtk.ApplicationWindow):
         self.coverpage = Gtk.Picture()
         self.coverpage.set_size_request(200, 300)
         self.coverpage.set_hexpand(True)
+        self.coverpage.connect("notify::scale-factor", self.cover_scale_changed)
         cover_page_button.set_child(self.coverpage)
         self.panes.set_start_child(cover_page_button)
 
@@ -367,251 +480,80 @@ class MainWindow(Gtk.ApplicationWindow):
         tab.set_column_spacing(3)
         scrolled.set_child(tab)
 
-        label: Gtk.Label = Gtk.Label.new("Title:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 0, 1, 1)
-        self.book_title = Gtk.Entry()
-        self.book_title.set_hexpand(True)
+        self.book_title = Gtk.Entry(hexpand=True)
         self.book_title.connect("changed", self.entry_changed)
-        tab.attach(self.book_title, 1, 0, 1, 1)
-
-        # Authors
-        label = Gtk.Label.new("Author(s):")
-        label.set_xalign(1)
-        tab.attach(label, 0, 1, 1, 1)
-        self.authors: Gtk.Entry = Gtk.Entry()
-        self.authors.set_editable(False)
-        self.authors.set_can_focus(False)
-        self.authors.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.authors.set_icon_sensitive(Gtk.EntryIconPosition.SECONDARY, True)
-        self.authors.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.authors.connect("icon-press", self.edit_authors)
-        tab.attach(self.authors, 1, 1, 1, 1)
-
-        # Series
-        label = Gtk.Label.new("Series:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 2, 1, 1)
-        self.series: Gtk.Entry = Gtk.Entry()
-        self.series.set_can_focus(False)
-        self.series.set_editable(False)
-        self.series.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.series.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.series.connect("icon-press", self.edit_series)
-        tab.attach(self.series, 1, 2, 1, 1)
-
-        # Genres
-        label = Gtk.Label.new("Genres:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 3, 1, 1)
-        self.genres: Gtk.Entry = Gtk.Entry()
-        self.genres.set_can_focus(False)
-        self.genres.set_editable(False)
-        self.genres.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.genres.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.genres.connect("icon-press", self.edit_genres)
-        tab.attach(self.genres, 1, 3, 1, 1)
-
-        # Characters
-        label = Gtk.Label.new("Characters:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 4, 1, 1)
-        self.characters: Gtk.Entry = Gtk.Entry()
-        self.characters.set_editable(False)
-        self.characters.set_can_focus(False)
-        self.characters.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.characters.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.characters.connect("icon-press", self.edit_characters)
-        tab.attach(self.characters, 1, 4, 1, 1)
-
-        # Annotation
-        label = Gtk.Label.new("Annotation:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 5, 1, 1)
-        self.annotation: Gtk.Entry = Gtk.Entry()
-        self.annotation.set_editable(False)
-        # self.annotation.set_can_focus(False)
-        # self.annotation.set_
-        self.annotation.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.annotation.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.annotation.connect("icon-press", self.edit_annotation)
-        tab.attach(self.annotation, 1, 5, 1, 1)
-
-        # Keywords
-        label = Gtk.Label.new("Keywords:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 6, 1, 1)
-        self.keywords: Gtk.Entry = Gtk.Entry()
-        self.keywords.set_editable(False)
-        self.keywords.set_can_focus(False)
-        self.keywords.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "tag-symbolic")
-        self.keywords.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.keywords.connect("icon-press", self.edit_keywords)
-        tab.attach(self.keywords, 1, 6, 1, 1)
-
-        # Languages
-        label = Gtk.Label.new("Languages:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 7, 1, 1)
-        self.languages: Gtk.Entry = Gtk.Entry()
-        self.languages.set_editable(False)
-        self.languages.set_can_focus(False)
-        self.languages.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "language-chooser-symbolic")
-        self.languages.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.languages.connect("icon-press", self.edit_languages)
-        tab.attach(self.languages, 1, 7, 1, 1)
-
-        # databaseref
-        label = Gtk.Label.new("Database Reference:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 8, 1, 1)
-        self.databaseref: Gtk.Entry = Gtk.Entry()
-        self.databaseref.set_editable(False)
-        self.databaseref.set_can_focus(False)
-        self.databaseref.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.databaseref.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.databaseref.connect("icon-press", self.edit_dbref)
-        tab.attach(self.databaseref, 1, 8, 1, 1)
-
-        # content rating
-        label = Gtk.Label.new("Content Rating:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 9, 1, 1)
-        self.rating: Gtk.Entry = Gtk.Entry()
-        self.rating.set_editable(False)
-        self.rating.set_can_focus(False)
-        self.rating.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.rating.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.rating.connect("icon-press", self.edit_ratings)
-        tab.attach(self.rating, 1, 9, 1, 1)
-
+        self.authors: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_authors)
+        self.series: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_series)
+        self.genres: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_genres)
+        self.characters: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_characters)
+        self.annotation: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_annotation)
+        self.annotation.set_can_focus(True)
+        self.keywords: Gtk.Entry = self.create_edit_entry("tag-symbolic", self.edit_keywords)
+        self.languages: Gtk.Entry = self.create_edit_entry("language-chooser-symbolic", self.edit_languages)
+        self.databaseref: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_dbref)
+        self.rating: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_ratings)
         # reading direction # 1.2
-        label = Gtk.Label.new("Reading Direction:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 10, 1, 1)
         self.reading: Gtk.DropDown = Gtk.DropDown.new_from_strings(["LTR", "RTL"])
-        tab.attach(self.reading, 1, 10, 1, 1)
 
         # publish-info
-        sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-        sep.set_margin_top(5)
-        sep.set_margin_bottom(5)
-        tab.attach(sep, 0, 11, 2, 1)
-
-        # Publisher
-        label = Gtk.Label.new("Publisher:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 12, 1, 1)
         self.publisher: Gtk.Entry = Gtk.Entry()
         self.publisher.connect("changed", self.entry_changed)
-        tab.attach(self.publisher, 1, 12, 1, 1)
-
-        # Publish Date
-        label = Gtk.Label.new("Publish Date:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 13, 1, 1)
-        self.publish_date: Gtk.Entry = Gtk.Entry()
-        self.publish_date.set_editable(False)
-        self.publish_date.set_can_focus(False)
-        self.publish_date.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "view-calendar-symbolic")
-        self.publish_date.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.publish_date.connect("icon-press", self.edit_publish_date)
-        tab.attach(self.publish_date, 1, 13, 1, 1)
-
-        # City
-        label = Gtk.Label.new("City:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 14, 1, 1)
+        self.publish_date: Gtk.Entry = self.create_edit_entry("view-calendar-symbolic", self.edit_publish_date)
         self.city: Gtk.Entry = Gtk.Entry()
         self.city.connect("changed", self.entry_changed)
-        tab.attach(self.city, 1, 14, 1, 1)
-
-        # ISBN
-        label = Gtk.Label.new("ISBN:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 15, 1, 1)
         self.isbn: Gtk.Entry = Gtk.Entry()
         self.isbn.connect("changed", self.entry_changed)
-        tab.attach(self.isbn, 1, 15, 1, 1)
-
-        # License
-        label = Gtk.Label.new("License:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 16, 1, 1)
         self.license: Gtk.Entry = Gtk.Entry()
         self.license.connect("changed", self.entry_changed)
-        tab.attach(self.license, 1, 16, 1, 1)
 
         # document-info
-        sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
-        sep.set_margin_top(5)
-        sep.set_margin_bottom(5)
-        tab.attach(sep, 0, 17, 2, 1)
-
-        # Doc ID
-        label = Gtk.Label.new("Document ID:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 18, 1, 1)
-        self.doc_id: Gtk.Entry = Gtk.Entry()
-        self.doc_id.set_sensitive(False)
-        self.doc_id.set_tooltip_text("Unique document ID (UUID)")
-        tab.attach(self.doc_id, 1, 18, 1, 1)
-
-        # Doc Author
-        label = Gtk.Label.new("Author(s):")
-        label.set_xalign(1)
-        tab.attach(label, 0, 19, 1, 1)
-        self.doc_author: Gtk.Entry = Gtk.Entry()
-        self.doc_author.set_editable(False)
-        self.doc_author.set_can_focus(False)
-        self.doc_author.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.doc_author.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.doc_author.connect("icon-press", self.edit_authors, True)
-        tab.attach(self.doc_author, 1, 19, 1, 1)
-
-        # creation date
-        label = Gtk.Label.new("Creation Date:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 20, 1, 1)
-        self.creation_date: Gtk.Entry = Gtk.Entry()
-        self.creation_date.set_editable(False)
-        self.creation_date.set_can_focus(False)
+        self.doc_id: Gtk.Entry = Gtk.Entry(sensitive=False, tooltip_text="Unique document ID (UUID)")
+        self.doc_author: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_authors, True)
+        self.creation_date: Gtk.Entry = self.create_edit_entry("view-calendar-symbolic", self.edit_creation_date)
         self.creation_date.set_tooltip_text("The creation date of this ACBF document")
-        self.creation_date.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "view-calendar-symbolic")
-        self.creation_date.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.creation_date.connect("icon-press", self.edit_creation_date)
-        tab.attach(self.creation_date, 1, 20, 1, 1)
-
-        # source
-        label = Gtk.Label.new("Source(s):")
-        label.set_xalign(1)
-        tab.attach(label, 0, 21, 1, 1)
-        self.source: Gtk.Entry = Gtk.Entry()
-        self.source.set_editable(False)
-        self.source.set_can_focus(False)
-        self.source.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.source.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.source.connect("icon-press", self.edit_source)
-        tab.attach(self.source, 1, 21, 1, 1)
-
-        # version
-        label = Gtk.Label.new("Version:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 22, 1, 1)
+        self.source: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_source)
         self.version: Gtk.Entry = Gtk.Entry()
-        tab.attach(self.version, 1, 22, 1, 1)
-
-        # history
-        label = Gtk.Label.new("History:")
-        label.set_xalign(1)
-        tab.attach(label, 0, 23, 1, 1)
-        self.history: Gtk.Entry = Gtk.Entry()
-        self.history.set_editable(False)
-        self.history.set_can_focus(False)
-        self.history.set_icon_from_icon_name(Gtk.EntryIconPosition.SECONDARY, "edit-symbolic")
-        self.history.set_icon_tooltip_text(Gtk.EntryIconPosition.SECONDARY, "Click to edit")
-        self.history.connect("icon-press", self.edit_history)
-        tab.attach(self.history, 1, 23, 1, 1)
+        self.history: Gtk.Entry = self.create_edit_entry("edit-symbolic", self.edit_history)
+
+        # label and widget of each grid row, None marks a separator between the info sections
+        form_rows: list[tuple[str, Gtk.Widget] | None] = [
+            ("Title:", self.book_title),
+            ("Author(s):", self.authors),
+            ("Series:", self.series),
+            ("Genres:", self.genres),
+            ("Characters:", self.characters),
+            ("Annotation:", self.annotation),
+            ("Keywords:", self.keywords),
+            ("Languages:", self.languages),
+            ("Database Reference:", self.databaseref),
+            ("Content Rating:", self.rating),
+            ("Reading Direction:", self.reading),
+            None,
+            ("Publisher:", self.publisher),
+            ("Publish Date:", self.publish_date),
+            ("City:", self.city),
+            ("ISBN:", self.isbn),
+            ("License:", self.license),
+            None,
+            ("Document ID:", self.doc_id),
+            ("Author(s):", self.doc_author),
+            ("Creation Date:", self.creation_date),
+            ("Source(s):", self.source),
+            ("Version:", self.version),
+            ("History:", self.history),
+        ]
+        for row, form_row in enumerate(form_rows):
+            if form_row is None:
+                sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
+                sep.set_margin_top(5)
+                sep.set_margin_bottom(5)
+                tab.attach(sep, 0, row, 2, 1)
+            else:
+                label_text, widget = form_row
+                label: Gtk.Label = Gtk.Label.new(label_text)
+                label.set_xalign(1)
+                tab.attach(label, 0, row, 1, 1)
+                tab.attach(widget, 1, row, 1, 1)
 
         self.update_languages()
 
@@ -633,11 +575,50 @@ class MainWindow(Gtk.ApplicationWindow):
             self.frames_action.set_enabled(False)
             self.styles_action.set_enabled(False)
 
+    @property
+    def all_langs(self) -> Gio.ListStore:
+        if self.iso_lang_store is None:
+            self.iso_lang_store = self._build_iso_langs()
+        return self.iso_lang_store
+
+    def _build_iso_langs(self) -> Gio.ListStore:
+        """The store of all ISO languages, filling in iso_lang_positions as it goes."""
+        store = Gio.ListStore.new(Language)
+        languages = [
+            Language(lang_iso=iso_lang.alpha_2, lang=iso_lang.name)
+            for iso_lang in pycountry.languages
+            if hasattr(iso_lang, "alpha_2")
+        ]
+        # one splice rather than an items-changed signal per language
+        store.splice(0, 0, languages)
+        for position, language in enumerate(languages):
+            self.iso_lang_positions.setdefault(language.lang_iso, position)
+        return store
+
+    def lang_position(self, lang_iso: str) -> int:
+        """Position of a language in the all_langs store, the first one if it is not listed."""
+        if self.iso_lang_store is None:
+            self.iso_lang_store = self._build_iso_langs()
+        return self.iso_lang_positions.get(lang_iso, 0)
+
+    def create_edit_entry(self, icon_name: str, callback: Callable[..., Any], *args: Any) -> Gtk.Entry:
+        """Read-only entry summarising a value that is edited through its icon."""
+        # construct properties are all set in one go
+        entry = Gtk.Entry(
+            editable=False,
+            can_focus=False,
+            secondary_icon_name=icon_name,
+            secondary_icon_tooltip_text="Click to edit",
+        )
+        entry.connect("icon-press", callback, *args)
+        return entry
+
     def create_tempdir(self) -> None:
         if self.preferences.get_value("tmpfs") == "True":
-            self.tempdir = str(os.path.join(self.preferences.get_value("tmpfs_dir"), "acbfe"))
-            if not os.path.exists(self.tempdir):
-                os.makedirs(self.tempdir)
+            tmpfs_dir = self.preferences.get_value("tmpfs_dir")
+            os.makedirs(tmpfs_dir, exist_ok=True)
+            # a random name per instance, clean_temp removes it again
+            self.tempdir = tempfile.mkdtemp(prefix="acbfe_", dir=tmpfs_dir)
             logger.info("Temporary directory override set to: " + self.tempdir)
         else:
             self.tempdir_obj = tempfile.TemporaryDirectory(prefix="acbfe_")
@@ -646,12 +627,8 @@ class MainWindow(Gtk.ApplicationWindow):
     def dedupe_langs(self, langs: Gio.ListStore) -> Gio.ListStore:
         new_langs: Gio.ListStore = Gio.ListStore.new(item_type=Language)
         seen_lang_isos: set[str] = set()
-        i = 0
 
-        while i < 9999:
-            item = langs.get_item(i)
-            if item is None:
-                break
+        for item in langs:
             lang_iso = item.lang_iso
 
             if lang_iso not in seen_lang_isos:
@@ -665,8 +642,6 @@ class MainWindow(Gtk.ApplicationWindow):
                     ),
                 )
 
-            i += 1
-
         return new_langs
 
     def setup_lang_item(self, factory: Gtk.ListItemFactory, list_item: Gtk.ListItem) -> None:
@@ -696,17 +671,12 @@ class MainWindow(Gtk.ApplicationWindow):
     def set_header_title(self) -> None:
         book_title = "*" if self.is_modified else ""
         if self.acbf_document.valid:
-            try:
-                book_title = (
-                    unescape(self.acbf_document.book_title[self.lang_button.get_selected_item().lang_iso]) + book_title
-                )
-            except Exception:
-                book_title = (
-                    unescape(
-                        self.acbf_document.book_title[list(self.acbf_document.book_title.items())[0][0]],
-                    )
-                    + book_title
-                )
+            titles = self.acbf_document.book_title
+            item: Language | None = self.lang_button.get_selected_item()
+            title = titles.get(item.lang_iso) if item is not None else None
+            if not title:
+                title = next((title for title in titles.values() if title), "")
+            book_title = _unescaped(title) + book_title
 
             self.set_title(f"{book_title} - ACBF Editor")
         else:
@@ -732,111 +702,191 @@ class MainWindow(Gtk.ApplicationWindow):
         if (state & Gdk.ModifierType.CONTROL_MASK) and keyval == ord('x'):
             self.exit_program()"""
 
+    def cmd_format(self, value: str) -> str | None:
+        formats_supported = ("JPG", "PNG", "GIF", "WEBP", "BMP")
+        if value.upper() not in formats_supported:
+            print(
+                "Error: Unrecognized image format:",
+                value + ". Use one of following: " + ", ".join(formats_supported),
+            )
+            self.exit_program()
+            return None
+        return value
+
+    def cmd_quality(self, value: str) -> int | None:
+        try:
+            if int(value) > 0 and int(value) < 101:
+                return int(value)
+            else:
+                raise ValueError("Image quality must be an integer between 0 and 100.")
+        except Exception:
+            print("")
+            print("Error: Image quality must be an integer between 0 and 100.")
+            self.exit_program()
+            return None
+
+    def cmd_resize(self, value: str) -> tuple[int, int, str] | None:
+        match = _GEOMETRY_RE.match(value)
+        if match is not None:
+            return int(match[1]), int(match[2]), match[3]
+        print("")
+        print("Error: Image geometry must be in format [width]x[height][flag].")
+        print("[width] and [height] defines target image size as integer.")
+        print("[flag] defines wheather to shrink (>) or enlarge (<) target image.")
+        self.exit_program()
+        return None
+
+    def cmd_filter(self, value: str) -> str | None:
+        if value.upper() not in _RESIZE_FILTERS:
+            print(
+                "Error: Unrecognized resize filter:",
+                value + ". Use one of following: NEAREST, BILINEAR, BICUBIC, ANTIALIAS.",
+            )
+            self.exit_program()
+            return None
+        return value.upper()
+
+    def cmd_text_layer(self, value: str) -> int | None:
+        shown_layers = {lang: i for i, (lang, show) in enumerate(self.acbf_document.languages) if show}
+        text_layer = shown_layers.get(value)
+        if text_layer is None:
+            logger.error("Error: Language layer %s is not defined in comic book.", value)
+            self.exit_program()
+        else:
+            for item in self.acbf_document.tree.iterfind("meta-data/book-info/languages/text-layer"):
+                if item.get("show") == "False":
+                    item.attrib["lang"] = value
+        return text_layer
+
     def convert_images(
         self,
         im_format: str | None,
         im_quality: int | None,
-        im_geometry: str | None,
+        im_geometry: tuple[int, int, str] | None,
         im_filter: str | None,
         im_text_layer: int | None,
     ) -> None:
-        resize_filters = {
-            "NEAREST": 0,
-            "BILINEAR": 2,
-            "BICUBIC": 3,
-            "ANTIALIAS": 1,
-        }
         if im_filter is None:
             im_filter = "ANTIALIAS"
 
-        for idx, page in enumerate(self.acbf_document.pages, start=1):
-            in_path = os.path.join(
-                self.tempdir,
-                page.find("image").get("href").replace("\\", "/"),
-            )
-            in_path_short = in_path[len(self.tempdir) + 1 :]
-            if im_format is None:
-                im_format = os.path.splitext(in_path)[1][1:]
-            out_path = os.path.splitext(in_path)[0] + "." + im_format.lower()
-            out_path_short = out_path[len(self.tempdir) + 1 :]
-            page.find("image").attrib["href"] = out_path_short
-            perc_done = str(int(round(float(idx) / float(self.acbf_document.pages_total) * 100, 0))).rjust(4) + "%"
-            print(perc_done, in_path_short, "->", out_path_short)
-
-            # convert image
-            if in_path != out_path or im_geometry is not None or im_text_layer is not None:
-                if im_text_layer is not None and idx > 0:
-                    xx = tl.TextLayer(
-                        in_path,
-                        idx + 1,
-                        self.acbf_document,
-                        im_text_layer,
-                        frames_editor.TextLayerItem(
-                            [(0, 0)],
-                            "",
-                            "",
-                            False,
-                            False,
-                            "",
-                            0,
-                            [],
-                        ),
-                        frames_editor.FrameItem([], ""),
-                    )
-                    im = xx.PILBackgroundImage
-                else:
-                    im = Image.open(in_path).convert("RGB")
-
-                    # resize
-                if im_geometry is not None:
-                    geometry_flag = im_geometry[-1:]
-                    geometry_x = int(im_geometry[0 : im_geometry.find("x")])
-                    geometry_y = int(im_geometry[im_geometry.find("x") + 1 : -1])
-                    ratio_x = geometry_x / float(im.size[0])
-                    ratio_y = geometry_y / float(im.size[1])
-                    ratio = min(ratio_x, ratio_y)
-
-                    if (geometry_flag == ">" and (im.size[0] > geometry_x or im.size[1] > geometry_y)) or (
-                        geometry_flag == "<" and (im.size[0] < geometry_x and im.size[1] < geometry_y)
-                    ):
-                        # scale image
-                        im = im.resize(
-                            [int(ratio * s) for s in im.size],
-                            resize_filters[im_filter],
-                        )
-                        # scale frames
-                        for frame in page.findall("frame"):
-                            new_coord = ""
-                            for coord in frame.get("points").split(" "):
-                                new_point = (
-                                    round(int(coord.split(",")[0]) * ratio, 0),
-                                    round(int(coord.split(",")[1]) * ratio, 0),
-                                )
-                                new_coord = new_coord + str(int(new_point[0])) + "," + str(int(new_point[1])) + " "
-
-                            frame.attrib["points"] = new_coord.strip()
-                        # scale text-layers
-                        for text_layer in page.findall("text-layer"):
-                            for text_area in text_layer.findall("text-area"):
-                                new_coord = ""
-                                for coord in text_area.get("points").split(" "):
-                                    new_point = (
-                                        round(int(coord.split(",")[0]) * ratio, 0),
-                                        round(int(coord.split(",")[1]) * ratio, 0),
-                                    )
-                                    new_coord = new_coord + str(int(new_point[0])) + "," + str(int(new_point[1])) + " "
-
-                                text_area.attrib["points"] = new_coord.strip()
-
-                # save
-                if im_quality is not None:
-                    im.save(out_path, quality=im_quality)
-                else:
-                    im.save(out_path)
-
-            # delete original image
-            if in_path != out_path:
+        # pages are decoded, resized and encoded in worker threads, only the XML is updated here
+        workers = os.cpu_count() or 1
+        # a bounded queue keeps open source files and decoded pages in check
+        conversions: collections.deque[tuple[concurrent.futures.Future[None], Any]] = collections.deque()
+        replaced: list[str] = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            try:
+                # worked out with the output format, which may come from the first page
+                save_options: tuple[dict[str, Any], dict[str, Any]] | None = None
+                tempdir = self.tempdir
+                short_start = len(tempdir) + 1
+                pages_total = self.acbf_document.pages_total
+                for idx, page in enumerate(self.acbf_document.pages, start=1):
+                    image = page.find("image")
+                    in_path = os.path.join(tempdir, image.get("href").replace("\\", "/"))
+                    in_root, in_ext = os.path.splitext(in_path)
+                    in_path_short = in_path[short_start:]
+                    if im_format is None:
+                        im_format = in_ext[1:]
+                    if save_options is None:
+                        save_options = _save_options(im_format, im_quality)
+                    out_path = in_root + "." + im_format.lower()
+                    out_path_short = out_path[short_start:]
+                    image.set("href", out_path_short)
+                    perc_done = str(int(round(float(idx) / float(pages_total) * 100, 0))).rjust(4) + "%"
+                    print(perc_done, in_path_short, "->", out_path_short)
+
+                    # convert image
+                    if in_path != out_path or im_geometry is not None or im_text_layer is not None:
+                        if im_text_layer is not None and idx > 0:
+                            xx = tl.TextLayer(
+                                in_path,
+                                idx + 1,
+                                self.acbf_document,
+                                im_text_layer,
+                                frames_editor.TextLayerItem(
+                                    [(0, 0)],
+                                    "",
+                                    "",
+                                    False,
+                                    False,
+                                    "",
+                                    0,
+                                    [],
+                                ),
+                                frames_editor.FrameItem([], ""),
+                            )
+                            im = xx.PILBackgroundImage
+                        elif pyvips is not None:
+                            # libvips streams decode, resize and encode instead of holding the full page in memory
+                            im = pyvips.Image.new_from_file(in_path, access="sequential")
+                            if im.hasalpha():
+                                im = im.flatten()
+                        else:
+                            # only the header is read here, the pixels are decoded by the worker
+                            im = Image.open(in_path)
+
+                            # resize
+                        scale: tuple[int, int] | None = None
+                        if im_geometry is not None:
+                            geometry_x, geometry_y, geometry_flag = im_geometry
+                            width, height = im.width, im.height
+                            # keep the scale ratio as an integer fraction of the limiting side
+                            if geometry_x * height <= geometry_y * width:
+                                num, den = geometry_x, width
+                            else:
+                                num, den = geometry_y, height
+
+                            if num != den and (
+                                (geometry_flag == ">" and (width > geometry_x or height > geometry_y))
+                                or (geometry_flag == "<" and (width < geometry_x and height < geometry_y))
+                            ):
+                                scale = (num, den)
+                                # scale frames and text-layers text-areas
+                                _scale_page_points(page, num, den)
+
+                        # convert and save image, unless re-encoding would be a no-op
+                        if (
+                            in_path != out_path
+                            or scale is not None
+                            or im_text_layer is not None
+                            or im_quality is not None
+                        ):
+                            while len(conversions) >= 2 * workers:
+                                _finish_conversion(*conversions.popleft())
+                            conversion = pool.submit(
+                                _convert_page,
+                                im,
+                                out_path,
+                                save_options,
+                                scale,
+                                _RESIZE_FILTERS[im_filter],
+                                _VIPS_KERNELS[im_filter],
+                            )
+                            conversions.append((conversion, im))
+                            if in_path != out_path:
+                                replaced.append(in_path)
+                        elif isinstance(im, Image.Image):
+                            im.close()
+
+                while conversions:
+                    # re-raise any conversion error
+                    _finish_conversion(*conversions.popleft())
+            except BaseException:
+                # once a page fails no more are started, the queued ones are dropped
+                pool.shutdown(cancel_futures=True)
+                for _conversion, im in conversions:
+                    if isinstance(im, Image.Image):
+                        im.close()
+                raise
+
+        # originals go once every page is written, a failed conversion leaves them all in place
+        for in_path in replaced:
+            try:
                 os.remove(in_path)
+            except OSError as e:
+                logger.warning(f"Failed to remove {in_path}: {e}")
 
     def open_preferences(self, action: Gio.SimpleAction | None, _pspec: GObject.GParamSpec) -> None:
         prefs_dialog = prefsdialog.PrefsDialog(self)
@@ -894,66 +944,52 @@ class MainWindow(Gtk.ApplicationWindow):
         dialog = edit_history.HistoryDialog(self)
         dialog.present()
 
+    def update_placeholder(self, entry: Gtk.Entry, text: str) -> None:
+        # Setting the placeholder queues a resize and redraw of the entry, skip it when nothing changed
+        if entry.get_placeholder_text() != text:
+            entry.set_placeholder_text(text)
+
     def genre_widget_update(self) -> None:
-        self.genres.set_placeholder_text(
-            ", ".join([g[0].replace("_", " ").capitalize() for g in self.acbf_document.genres]),
+        self.update_placeholder(
+            self.genres,
+            ", ".join(g[0].replace("_", " ").capitalize() for g in self.acbf_document.genres),
         )
 
     def char_widget_update(self) -> None:
-        self.characters.set_placeholder_text(", ".join(sorted(self.acbf_document.characters)))
+        self.update_placeholder(self.characters, ", ".join(sorted(self.acbf_document.characters)))
 
     def sources_widget_update(self) -> None:
-        self.source.set_placeholder_text(", ".join(self.acbf_document.sources))
+        self.update_placeholder(self.source, ", ".join(self.acbf_document.sources))
 
     def history_widget_update(self) -> None:
-        self.history.set_placeholder_text(
+        self.update_placeholder(
+            self.history,
             ", ".join(self.acbf_document.history),
         )
 
     def rating_widget_update(self) -> None:
-        self.rating.set_placeholder_text(", ".join([f"{r[0]} - {r[1]}" for r in self.acbf_document.content_ratings]))
+        self.update_placeholder(self.rating, ", ".join(f"{r[0]} - {r[1]}" for r in self.acbf_document.content_ratings))
 
     def series_widget_update(self) -> None:
-        self.series.set_placeholder_text(", ".join([s[0] for s in self.acbf_document.sequences]))
+        self.update_placeholder(self.series, ", ".join(s[0] for s in self.acbf_document.sequences))
 
     def keywords_widget_update(self) -> None:
-        self.keywords.set_placeholder_text(", ".join(sorted(self.acbf_document.keywords)))
+        self.update_placeholder(self.keywords, ", ".join(sorted(self.acbf_document.keywords)))
 
     def dbref_widget_update(self) -> None:
-        dbnames = []
-        for item in self.acbf_document.databaseref:
-            dbnames.append(item["dbname"])
-        self.databaseref.set_placeholder_text(", ".join(dbnames))
+        self.update_placeholder(self.databaseref, ", ".join(item["dbname"] for item in self.acbf_document.databaseref))
 
     def lang_widget_update(self) -> None:
-        languages: list[str] = []
-        for lang in self.acbf_document.languages:
-            if lang[1]:
-                languages.append(lang[0])
-            else:
-                languages.append(lang[0] + " (no text layer)")
-
-        self.languages.set_placeholder_text(", ".join(languages))
+        self.update_placeholder(
+            self.languages,
+            ", ".join(lang[0] if lang[1] else f"{lang[0]} (no text layer)" for lang in self.acbf_document.languages),
+        )
 
     def authors_widget_update(self) -> None:
-        authors_text = []
-        for authors in self.acbf_document.authors:
-            if authors.get("first_name"):
-                authors_text.append(authors["first_name"] + " " + authors.get("last_name", ""))
-            elif authors.get("nickname"):
-                authors_text.append(authors["nickname"])
-
-        self.authors.set_placeholder_text(", ".join(authors_text))
+        self.update_placeholder(self.authors, _author_names(self.acbf_document.authors))
 
     def doc_authors_widget_update(self) -> None:
-        authors_text = []
-        for authors in self.acbf_document.doc_authors:
-            if authors.get("first_name"):
-                authors_text.append(authors["first_name"] + " " + authors.get("last_name", ""))
-            elif authors.get("nickname"):
-                authors_text.append(authors["nickname"])
-
-        self.doc_author.set_placeholder_text(", ".join(authors_text))
+        self.update_placeholder(self.doc_author, _author_names(self.acbf_document.doc_authors))
 
     def anno_widget_update(self) -> None:
         anno_text: str = ""
@@ -963,19 +999,37 @@ class MainWindow(Gtk.ApplicationWindow):
         # If this is placeholder text any newlines expand the box
         self.annotation.set_text(anno_text)
 
-    def cover_widget_update(self) -> None:
+    def cover_widget_update(self, cover_changed: bool = True) -> None:
+        if cover_changed:
+            self.cover_textures.clear()
+        # Converting a large cover is slow, leave it until the window is idle
+        if self.acbf_document.cover_page is not None and self.cover_update_id == 0:
+            self.cover_update_id = GLib.idle_add(self.set_cover_pixbuf)
+
+    def set_cover_pixbuf(self) -> bool:
+        self.cover_update_id = 0
         if self.acbf_document.cover_page is not None:
-            self.coverpage.set_pixbuf(self.pil_to_pixbuf(self.acbf_document.cover_page))
+            scale = self.coverpage.get_scale_factor()
+            target_size = (
+                max(self.coverpage.get_width(), 200) * scale,
+                max(self.coverpage.get_height(), 300) * scale,
+            )
+            texture = self.cover_textures.get(target_size)
+            if texture is None:
+                texture = Gdk.Texture.new_for_pixbuf(self.pil_to_pixbuf(self.acbf_document.cover_page, target_size))
+                self.cover_textures[target_size] = texture
+            self.coverpage.set_paintable(texture)
+        return False
+
+    def cover_scale_changed(self, widget: Gtk.Picture, pspec: GObject.ParamSpec) -> None:
+        # Same cover, moved to a monitor with another scale
+        self.cover_widget_update(cover_changed=False)
 
     def edit_annotation(self, widget: Gtk.Button, pos: Gtk.EntryIconPosition) -> None:
         def save_and_exit(widget: Gtk.Popover, popup: Gtk.Popover) -> None:
-            new_text = anno_text.get_buffer().get_text(
-                anno_text.get_buffer().get_bounds()[0],
-                anno_text.get_buffer().get_bounds()[1],
-                False,
-            )
+            new_text = anno_buffer.get_text(*anno_buffer.get_bounds(), False)
             if new_text != old_text:
-                self.acbf_document.annotation[self.lang_button.get_selected_item().lang_iso] = new_text
+                self.acbf_document.annotation[lang_iso] = new_text
                 self.anno_widget_update()
                 self.modified()
             popup.popdown()
@@ -991,14 +1045,10 @@ class MainWindow(Gtk.ApplicationWindow):
         anno_text.set_margin_top(5)
         anno_text.set_margin_bottom(5)
         anno_text.set_wrap_mode(Gtk.WrapMode.WORD)
-        anno_text.get_buffer().set_text(
-            unescape(self.acbf_document.annotation.get(self.lang_button.get_selected_item().lang_iso, "")),
-        )
-        old_text = anno_text.get_buffer().get_text(
-            anno_text.get_buffer().get_bounds()[0],
-            anno_text.get_buffer().get_bounds()[1],
-            False,
-        )
+        lang_iso = self.lang_button.get_selected_item().lang_iso
+        anno_buffer = anno_text.get_buffer()
+        old_text = _unescaped(self.acbf_document.annotation.get(lang_iso, ""))
+        anno_buffer.set_text(old_text)
 
         popup.set_child(anno_text)
         popup.popup()
@@ -1008,13 +1058,7 @@ class MainWindow(Gtk.ApplicationWindow):
         popup.set_parent(widget)
         calendar = Gtk.Calendar()
 
-        try:
-            calendar_date = GLib.DateTime.new_from_iso8601(self.publish_date.get_text() + "T00:00:00Z")
-        except Exception as e:
-            calendar_date = GLib.DateTime.new_now_local()
-            logger.warning(f"Failed to parse date: {self.publish_date.get_text()} with error: {e}")
-
-        calendar.select_day(calendar_date)
+        calendar.select_day(_calendar_date(self.publish_date.get_text()))
         calendar.connect("day-selected", self.update_publish_date_entry)
 
         popup.set_child(calendar)
@@ -1026,13 +1070,7 @@ class MainWindow(Gtk.ApplicationWindow):
         popup.set_parent(widget)
         calendar = Gtk.Calendar()
 
-        try:
-            calendar_date = GLib.DateTime.new_from_iso8601(self.creation_date.get_text() + "T00:00:00Z")
-        except Exception as e:
-            calendar_date = GLib.DateTime.new_now_local()
-            logger.warning(f"Failed to parse date: {self.creation_date.get_text()} with error: {e}")
-
-        calendar.select_day(calendar_date)
+        calendar.select_day(_calendar_date(self.creation_date.get_text()))
         calendar.connect("day-selected", self.update_creation_date_entry)
 
         popup.set_child(calendar)
@@ -1050,31 +1088,40 @@ class MainWindow(Gtk.ApplicationWindow):
         self.modified()
 
     def update_forms(self, is_new: bool) -> None:
+        # no modified tracking until all the fields are filled in
+        self.suspend_modified = True
+        try:
+            self._fill_forms(is_new)
+        finally:
+            self.suspend_modified = False
+
+        self.modified(False)
+
+    def _fill_forms(self, is_new: bool) -> None:
+        document = self.acbf_document
         if is_new:
             self.cover_widget_update()
             book_title = ""
-            if self.acbf_document.valid:
-                try:
-                    book_title = unescape(self.book_title_list[self.lang_button.get_selected_item().lang_iso])
-                except Exception:
-                    try:
-                        book_title = unescape(self.book_title_list["en"])
-                    except Exception:
-                        book_title = ""
+            if document.valid:
+                item: Language | None = self.lang_button.get_selected_item()
+                title = self.book_title_list.get(item.lang_iso) if item is not None else None
+                if title is None:
+                    title = self.book_title_list.get("en", "")
+                book_title = _unescaped(title)
 
             self.anno_widget_update()
             self.book_title.set_text(book_title)
             self.set_header_title()
             self.keywords_widget_update()
-            self.publisher.set_text(unescape(self.acbf_document.publisher))
-            self.city.set_text(self.acbf_document.city)
-            self.isbn.set_text(self.acbf_document.isbn)
-            self.version.set_text(self.acbf_document.version)
-            self.license.set_text(self.acbf_document.license)
+            self.publisher.set_text(_unescaped(document.publisher))
+            self.city.set_text(document.city)
+            self.isbn.set_text(document.isbn)
+            self.version.set_text(document.version)
+            self.license.set_text(document.license)
 
         self.authors_widget_update()
         self.doc_authors_widget_update()
-        self.doc_id.set_text(self.acbf_document.id)
+        self.doc_id.set_text(document.id)
         self.series_widget_update()
         self.genre_widget_update()
         self.char_widget_update()
@@ -1084,19 +1131,16 @@ class MainWindow(Gtk.ApplicationWindow):
         self.history_widget_update()
         self.rating_widget_update()
 
-        if self.acbf_document.reading_direction != "LTR":
+        if document.reading_direction != "LTR":
             self.reading.set_selected(1)
-        self.publish_date.set_text(self.acbf_document.publish_date_value)
-        self.creation_date.set_text(self.acbf_document.creation_date)
+        self.publish_date.set_text(document.publish_date_value)
+        self.creation_date.set_text(document.creation_date)
 
-        if len(self.acbf_document.languages) > 1:
+        if len(document.languages) > 1:
             self.lang_button.set_sensitive(True)
         else:
             self.lang_button.set_sensitive(False)
 
-        self.modified(False)
-        return
-
     # toolbar actions
     def open_file(self, widget: Gtk.Button | Gio.SimpleAction | None, _spec: GObject.GParamSpec | None = None) -> None:
         self.filename_before = self.filename
@@ -1141,7 +1185,8 @@ class MainWindow(Gtk.ApplicationWindow):
             self.styles_action.set_enabled(False)
 
     def show_about_window(self, action: Gio.SimpleAction, _pspec: GObject.GParamSpec) -> None:
-        logo = Gdk.Texture.new_from_filename("./images/acbfe.png")
+        if self.about_logo is None:
+            self.about_logo = Gdk.Texture.new_from_filename("./images/acbfe.png")
         dialog: Gtk.AboutDialog = Gtk.AboutDialog.new()
         dialog.set_program_name("ACBF Editor")
         dialog.set_version(constants.VERSION)
@@ -1151,7 +1196,7 @@ class MainWindow(Gtk.ApplicationWindow):
         dialog.add_credit_section("Creator", ["Robert Kubik"])
         dialog.add_credit_section("Developer(s)", ["mizaki"])
         dialog.set_copyright("© 2013-2019 Robert Kubik")
-        dialog.set_logo(logo)
+        dialog.set_logo(self.about_logo)
 
         dialog.present()
 
@@ -1161,14 +1206,18 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def update_languages(self) -> None:
         self.all_lang_store.remove_all()
-        for lang in self.acbf_document.languages:
-            lang_info = pycountry.languages.get(alpha_2=lang[0])
+        for lang_iso, show in self.acbf_document.languages:
+            if lang_iso != "??":
+                # so a title typed in for a language without one yet is kept on save
+                self.acbf_document.book_title.setdefault(lang_iso, "")
+                self.acbf_document.annotation.setdefault(lang_iso, "")
+            lang_info = _language_info(lang_iso)
             if lang_info:
                 lang_text = getattr(lang_info, "name", "")
                 new_lang = Language(
-                    lang_iso=lang[0],
-                    show=lang[1],
-                    lang=lang_text if lang[1] else lang_text + " (no text layers)",
+                    lang_iso=lang_iso,
+                    show=show,
+                    lang=lang_text if show else f"{lang_text} (no text layers)",
                 )
                 self.all_lang_store.append(new_lang)
 
@@ -1192,7 +1241,7 @@ class MainWindow(Gtk.ApplicationWindow):
         """Updates information from the main window entries to the acbfdocument python vars, calls save_to_tree"""
         selected_item = self.lang_button.get_selected_item()
         if selected_item is not None and selected_item.lang_iso in self.book_title_list:
-            self.book_title_list[self.lang_button.get_selected_item().lang_iso] = self.book_title.get_text()
+            self.book_title_list[selected_item.lang_iso] = self.book_title.get_text()
             self.acbf_document.book_title = self.book_title_list
 
         self.acbf_document.reading_direction = self.reading.get_selected_item().get_string()
@@ -1230,29 +1279,35 @@ class MainWindow(Gtk.ApplicationWindow):
         print("Saving file ...", output_file)
 
         try:
-            # create tree with namespace
-            tree = xml.Element("ACBF", xmlns="http://www.acbf.info/xml/acbf/1.1")
-            for element in self.acbf_document.tree.getroot():
-                tree.append(deepcopy(element))
-
-            with open(os.path.join(self.tempdir, os.path.basename(self.filename)), "wb") as f:
-                f.write(xml.tostring(tree, pretty_print=True, xml_declaration=True))
-
-            tree = None
-
-            # create CBZ file
+            acbf_name = os.path.basename(self.filename)
+
+            # collect files once, the count drives the progress bar; the ACBF copy in tempdir is stale
+            acbf_path = os.path.join(self.tempdir, acbf_name)
+            all_files = [
+                (os.path.join(root, file), os.path.join(os.path.relpath(root, self.tempdir), file))
+                for root, dirs, files in os.walk(self.tempdir)
+                for file in files
+                if os.path.join(root, file) != acbf_path
+            ]
+            total_files = len(all_files)
+
+            # create CBZ file, the ACBF document goes straight from memory
             with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zip:
-                processed_files = 0
-                for root, dirs, files in os.walk(self.tempdir):
-                    for file in files:
-                        processed_files = processed_files + 1
-                        fraction = float(processed_files) / len(files)
-                        if not self.is_cmd_line:
-                            progress_bar.set_fraction(fraction)
-                        filename = os.path.join(root, str(file))
-                        if os.path.isfile(filename):  # regular files only
-                            arcname = os.path.join(os.path.relpath(root, self.tempdir), str(file))
-                            zip.write(filename, arcname)
+                with zip.open(acbf_name, "w") as acbf_file:
+                    utils.write_acbf(self.acbf_document.tree.getroot(), acbf_file)
+
+                last_percent = -1
+                for processed_files, (filename, arcname) in enumerate(all_files, start=1):
+                    # move the bar in whole percent steps only
+                    percent = processed_files * 100 // total_files
+                    if not self.is_cmd_line and percent != last_percent:
+                        last_percent = percent
+                        progress_bar.set_fraction(percent / 100)
+                    # page images are already compressed, deflating them only costs time
+                    if filename.lower().endswith(fileprepare.IMAGE_EXTENSIONS):
+                        zip.write(filename, arcname, zipfile.ZIP_STORED)
+                    else:
+                        zip.write(filename, arcname)
 
             output_file_size = round(float(os.path.getsize(output_file)) / 1024 / 1024, 2)
             if not self.is_cmd_line:
@@ -1283,6 +1338,8 @@ class MainWindow(Gtk.ApplicationWindow):
         logger.info("Done")
 
     def entry_changed(self, widget: Gtk.Entry) -> None:
+        if self.suspend_modified:
+            return
         self.modified()
 
     def exit_program(self) -> None:
@@ -1334,6 +1391,8 @@ class MainWindow(Gtk.ApplicationWindow):
         logger.info("finish clean temp")
 
     def modified(self, modified: bool = True) -> None:
+        if self.suspend_modified:
+            return
         if self.is_modified is not modified:
             self.is_modified = modified
             self.set_header_title()
@@ -1350,10 +1409,17 @@ class MainWindow(Gtk.ApplicationWindow):
 
         return texture
 
-    def pil_to_pixbuf(self, PILImage: Image) -> GdkPixbuf:
+    def pil_to_pixbuf(self, PILImage: Image, target_size: tuple[int, int] | None = None) -> GdkPixbuf:
         # Parse the background color to get the RGB values
         try:
-            PILImage = PILImage.convert("RGBA")
+            # shrink to the displayed size first so only those pixels are converted and copied
+            if target_size is not None and (PILImage.width > target_size[0] or PILImage.height > target_size[1]):
+                PILImage = ImageOps.contain(PILImage, target_size, Image.Resampling.BILINEAR)
+
+            # RGB images (most pages) are passed as they are, skipping a full RGBA copy
+            has_alpha = PILImage.mode != "RGB"
+            if has_alpha:
+                PILImage = PILImage.convert("RGBA")
 
             # https://gist.github.com/mozbugbox/10cd35b2872628246140
             data = PILImage.tobytes()
@@ -1362,25 +1428,17 @@ class MainWindow(Gtk.ApplicationWindow):
             pix = GdkPixbuf.Pixbuf.new_from_bytes(
                 data,
                 GdkPixbuf.Colorspace.RGB,
-                True,
+                has_alpha,
                 8,
                 w,
                 h,
-                w * 4,
+                w * (4 if has_alpha else 3),
             )
             return pix
         except Exception as e:
             print("failed to create pixbuf with alpha: ", e)
-            bg = Image.new("RGBA", (150, 200), (0, 0, 0, 0))
-
-            dummy_file = io.BytesIO()
-            bg.save(dummy_file, "ppm")
-            dummy_file.seek(0)
-            contents = dummy_file.read()
-            dummy_file.close()
-
-            loader = GdkPixbuf.PixbufLoader.new_with_type("pnm")
-            loader.write(contents)
-            loader.close()
-            pixbuf = loader.get_pixbuf()
-            return pixbuf
+            # transparent placeholder, created once and shared
+            if self.fallback_pixbuf is None:
+                self.fallback_pixbuf = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, True, 8, 150, 200)
+                self.fallback_pixbuf.fill(0)
+            return self.fallback_pixbuf
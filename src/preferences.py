@@ -47,12 +47,11 @@ class Preferences:
             self.save_preferences()
         except Exception:
             self.create_new_tree()
-            with open(self.prefs_file_path, "w") as f:
-                f.write(xml.tostring(self.tree, encoding="unicode", pretty_print=True))
+            self.save_preferences()
 
     def save_preferences(self) -> None:
-        with open(self.prefs_file_path, "w") as f:
-            f.write(xml.tostring(self.tree, encoding="unicode", pretty_print=True))
+        # serialised straight to the file as UTF-8, whatever the platform's default encoding is
+        xml.ElementTree(self.tree).write(self.prefs_file_path, encoding="utf-8", pretty_print=True)
 
     def get_value(self, element: str) -> str:
         if self.tree.find(element) is not None:
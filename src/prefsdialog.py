@@ -165,7 +165,7 @@ class PrefsDialog(Gtk.Window):
 
         # Initialise values
         self.default_language.set_selected(
-            constants.LANGUAGES.index(self.parent.preferences.get_value("default_language")),
+            constants.LANGUAGES_INDEX.get(self.parent.preferences.get_value("default_language"), 0),
         )
         if self.parent.preferences.get_value("tmpfs") == "True":
             self.tmpfs_button.set_active(True)
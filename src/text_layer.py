@@ -55,83 +55,25 @@ class TextLayer:
         self.text_areas: Gio.ListStore[TextLayerItem] = text_layer
         self.polygon: list[tuple[int, int]] = []
         self.updated: bool = False
-        self.normal_font: str = acbf_document.font_styles["normal"]
-        self.strong_font: str = acbf_document.font_styles["strong"]
-        self.emphasis_font: str = acbf_document.font_styles["emphasis"]
-        self.code_font: str = acbf_document.font_styles["code"]
-        self.commentary_font: str = acbf_document.font_styles["commentary"]
-        self.sign_font: str = acbf_document.font_styles["sign"]
-        self.formal_font: str = acbf_document.font_styles["formal"]
-        self.heading_font: str = acbf_document.font_styles["heading"]
-        self.letter_font: str = acbf_document.font_styles["letter"]
-        self.audio_font: str = acbf_document.font_styles["audio"]
-        self.thought_font: str = acbf_document.font_styles["thought"]
+        self.fonts: dict[str, str] = dict(acbf_document.font_styles)  # style: font path
         self.frames: Gio.ListStore[FrameItem] = frames_layers
         self.frames_total = len(self.frames)
         self.draw_text_layer()
 
     def load_font(self, font: str, height: int) -> ImageFont:
-        if font == "normal":
-            if self.normal_font != "":
-                return ImageFont.truetype(self.normal_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "emphasis":
-            if self.emphasis_font != "":
-                return ImageFont.truetype(self.emphasis_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "strong":
-            if self.strong_font != "":
-                return ImageFont.truetype(self.strong_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "code":
-            if self.code_font != "":
-                return ImageFont.truetype(self.code_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "commentary":
-            if self.commentary_font != "":
-                return ImageFont.truetype(self.commentary_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "sign":
-            if self.sign_font != "":
-                return ImageFont.truetype(self.sign_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "formal":
-            if self.formal_font != "":
-                return ImageFont.truetype(self.formal_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "heading":
-            if self.heading_font != "":
-                return ImageFont.truetype(self.heading_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "letter":
-            if self.letter_font != "":
-                return ImageFont.truetype(self.letter_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "audio":
-            if self.audio_font != "":
-                return ImageFont.truetype(self.audio_font, height)
-            else:
-                return ImageFont.load_default()
-        elif font == "thought":
-            if self.thought_font != "":
-                return ImageFont.truetype(self.thought_font, height)
-            else:
-                return ImageFont.load_default()
+        font_path = self.fonts.get(font, "")
+        if font_path != "":
+            return ImageFont.truetype(font_path, height)
+        else:
+            return ImageFont.load_default()
 
     def remove_xml_tags(self, in_string: str) -> str:
         return unescape(re.sub("<[^>]*>", "", in_string))
 
     def draw_text_layer(self) -> None:
         # TODO Class?
+        # looked up for every chunk of every line
+        font_colors = self.acbf_document.font_colors
         text_areas_draw: list[
             tuple[
                 int,
@@ -1183,7 +1125,7 @@ class TextLayer:
             # drawing
             font = n_font
             font_small = n_font_small
-            font_color = self.acbf_document.font_colors["speech"]
+            font_color = font_colors["speech"]
             strikethrough_word = False
             use_small_font = False
             use_superscript = False
@@ -1192,35 +1134,35 @@ class TextLayer:
             if is_commentary:
                 font = co_font
                 font_small = co_font_small
-                font_color = self.acbf_document.font_colors["commentary"]
+                font_color = font_colors["commentary"]
             elif is_sign:
                 font = si_font
                 font_small = si_font_small
-                font_color = self.acbf_document.font_colors["sign"]
+                font_color = font_colors["sign"]
             elif is_formal:
                 font = fo_font
                 font_small = fo_font_small
-                font_color = self.acbf_document.font_colors["formal"]
+                font_color = font_colors["formal"]
             elif is_heading:
                 font = he_font
                 font_small = he_font_small
-                font_color = self.acbf_document.font_colors["heading"]
+                font_color = font_colors["heading"]
             elif is_letter:
                 font = le_font
                 font_small = le_font_small
-                font_color = self.acbf_document.font_colors["letter"]
+                font_color = font_colors["letter"]
             elif is_audio:
                 font = au_font
                 font_small = au_font_small
-                font_color = self.acbf_document.font_colors["audio"]
+                font_color = font_colors["audio"]
             elif is_thought:
                 font = th_font
                 font_small = th_font_small
-                font_color = self.acbf_document.font_colors["thought"]
+                font_color = font_colors["thought"]
             elif is_code:
                 font = c_font
                 font_small = c_font_small
-                font_color = self.acbf_document.font_colors["code"]
+                font_color = font_colors["code"]
 
             # idetify last line in paragraph
             for idx, line in enumerate(lines):
@@ -1261,12 +1203,12 @@ class TextLayer:
                         is_last_line = True
 
                     if "<INVERTED>" in chunk_upper or t_a[6]:
-                        font_color = self.acbf_document.font_colors["inverted"]
+                        font_color = font_colors["inverted"]
                         t_a = (t_a[0], t_a[1], t_a[2], t_a[3], t_a[4], t_a[5], True)
                     elif "</INVERTED>" in chunk_upper:
-                        font_color = self.acbf_document.font_colors[t_a[2].lower()]
+                        font_color = font_colors[t_a[2].lower()]
                     elif not t_a[6]:
-                        font_color = self.acbf_document.font_colors[t_a[2].lower()]
+                        font_color = font_colors[t_a[2].lower()]
 
                     if "<EMPHASIS>" in chunk_upper:
                         font = e_font
@@ -17,17 +17,39 @@ https://github.com/ACBF-Advanced-Comic-Book-Format/ACBF-Editor
 # along with this program; if not, write to the Free Software
 # -------------------------------------------------------------------------
 
+from __future__ import annotations
+
 from pathlib import Path
+import json
 import subprocess
 import plistlib
 import pathlib
 from PIL import ImageFont
+import lxml.etree as xml
 import os
 import sys
 import logging
+from typing import IO, Any
 
 logger = logging.getLogger(__name__)
 
+ACBF_NAMESPACE = "http://www.acbf.info/xml/acbf/1.1"
+
+
+def write_acbf(root: xml._Element, file: str | IO[bytes]) -> None:
+    """Write an ACBF document with the ACBF namespace declared once on the root.
+
+    Loaded documents have their tag namespaces stripped but keep the root's
+    nsmap, so the children are serialized under a fresh namespaced root.
+    They are moved there rather than copied, and moved back afterwards.
+    """
+    acbf_root = xml.Element("ACBF", nsmap={None: ACBF_NAMESPACE})
+    acbf_root.extend(root[:])
+    try:
+        xml.ElementTree(acbf_root).write(file, encoding="utf-8", pretty_print=True, xml_declaration=True)
+    finally:
+        root.extend(acbf_root[:])
+
 
 # Taken from Matplot https://github.com/matplotlib/matplotlib/blob/main/lib/matplotlib/font_manager.py
 # OS Font paths
@@ -68,30 +90,35 @@ OSXFontDirectories = [
     str(_HOME / "Library/Fonts"),
 ]
 
-FONT_STYLES = ["regular", "book", "demi", "italic", "oblique"]
-FONT_WEIGHTS = [
-    "thin",
-    "extralight",
-    "light",
-    "normal",
-    "medium",
-    "semibold",
-    "bold",
-    "extrabold",
-    "black",
-    "extrablack",
-]
-FONT_STRETCHES = [
-    "normal",
-    "semicondensed",
-    "condensed",
-    "extracondensed",
-    "ultracondensed",
-    "semi-expanded",
-    "expanded",
-    "extraexpanded",
-    "ultraexpanded",
-]
+# sets, every word of every font's style name is looked up in them
+FONT_STYLES = frozenset(["regular", "book", "demi", "italic", "oblique"])
+FONT_WEIGHTS = frozenset(
+    [
+        "thin",
+        "extralight",
+        "light",
+        "normal",
+        "medium",
+        "semibold",
+        "bold",
+        "extrabold",
+        "black",
+        "extrablack",
+    ]
+)
+FONT_STRETCHES = frozenset(
+    [
+        "normal",
+        "semicondensed",
+        "condensed",
+        "extracondensed",
+        "ultracondensed",
+        "semi-expanded",
+        "expanded",
+        "extraexpanded",
+        "ultraexpanded",
+    ]
+)
 
 
 def get_fontext_synonyms(fontext: str) -> list[str]:
@@ -112,13 +139,13 @@ def list_fonts(directory: str | Path, extensions: list[str]) -> list[str]:
     Return a list of all fonts matching any of the extensions, found
     recursively under the directory.
     """
-    extensions = ["." + ext for ext in extensions]
+    suffixes = tuple("." + ext for ext in extensions)
     return [
         os.path.join(dirpath, filename)
         # os.walk ignores access errors, unlike Path.glob.
         for dirpath, _, filenames in os.walk(directory)
         for filename in filenames
-        if Path(filename).suffix.lower() in extensions
+        if filename.lower().endswith(suffixes)
     ]
 
 
@@ -196,13 +223,80 @@ def _get_macos_fonts() -> list[Path]:
     return [Path(entry["path"]) for entry in d["_items"]]
 
 
-def findSystemFonts(fontpaths: list[str] | None = None, fontext: str = "ttf") -> dict[str, dict[str, str]]:
+# keys of the font info read by _read_font_info
+_FONT_INFO_KEYS = frozenset(("path", "name", "style", "weight", "stretch", "subfamily"))
+
+
+def _cache_entry_valid(cached: Any, stat: os.stat_result) -> bool:
+    """Whether a font cache entry is well formed and matches the file's mtime and size."""
+    if not isinstance(cached, dict) or "info" not in cached:
+        return False
+    info = cached["info"]
+    return (
+        cached.get("mtime") == stat.st_mtime_ns
+        and cached.get("size") == stat.st_size
+        and (info is None or (isinstance(info, dict) and _FONT_INFO_KEYS <= info.keys()))
+    )
+
+
+def _load_font_cache(cache_file: str) -> dict[str, Any]:
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_font_cache(cache_file: str, cache: dict[str, Any]) -> None:
+    try:
+        os.makedirs(os.path.dirname(cache_file), 0o700, exist_ok=True)
+        with open(cache_file + ".part", "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(cache_file + ".part", cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to write font cache {cache_file}: {e}")
+
+
+def _read_font_info(font_path: pathlib.Path) -> dict[str, str]:
+    pil_font_name = ImageFont.truetype(font_path).getname()
+
+    # style and weight and stretch are all in the same font "style" field
+    style_split = pil_font_name[1].split(" ")
+    style: str = "normal"
+    weight: str = "normal"
+    stretch: str = "normal"
+    for s in style_split:
+        word = s.casefold()
+        if word in FONT_STYLES:
+            style = word
+        elif word in FONT_WEIGHTS:
+            weight = word
+        elif word in FONT_STRETCHES:
+            stretch = word
+
+    return {
+        "path": str(font_path),
+        "name": str(pil_font_name[0]),
+        "style": style,
+        "weight": weight,
+        "stretch": stretch,
+        "subfamily": str(pil_font_name[1]),
+    }
+
+
+def findSystemFonts(
+    fontpaths: list[str] | None = None, fontext: str = "ttf", cache_file: str | None = None
+) -> dict[str, dict[str, str]]:
     """
     Search for fonts in the specified font paths.  If no paths are
     given, will use a standard set of system paths, as well as the
     list of fonts tracked by fontconfig if fontconfig is installed and
     available.  A list of TrueType fonts are returned by default with
     AFM fonts as an option.
+
+    With *cache_file* the names read from each font file are kept in a
+    JSON manifest and only read again when the file's mtime or size changes.
     """
     fontfiles: set[str] = set()
     fontexts = get_fontext_synonyms(fontext)
@@ -226,36 +320,49 @@ def findSystemFonts(fontpaths: list[str] | None = None, fontext: str = "ttf") ->
     for path in fontpaths:
         fontfiles.update(map(os.path.abspath, list_fonts(path, fontexts)))
 
-    fontpaths_list = [fname for fname in fontfiles if os.path.exists(fname)]
-
-    font_info: dict[str, dict[str, str]] = {}  # filename stem: full path, family name, style, weight, stretch
-    for font in fontpaths_list:
+    # path: mtime, size and font info, or None for files PIL can't read
+    old_cache: dict[str, Any] = _load_font_cache(cache_file) if cache_file else {}
+    # rebuilt from this scan, so fonts that are no longer installed drop out
+    cache: dict[str, Any] = {}
+    cache_changed = False
+
+    font_info: dict[str, dict[str, str]] = {}  # filename stem: path, name, style, weight, stretch, subfamily
+    # sorted, so the same copy of a duplicated font is picked (and cached) every time
+    for font in sorted(fontfiles):
+        font_path: pathlib.Path = pathlib.Path(font)
+        # The same font file is often installed in several places, only load the first one found
+        if font_path.stem.casefold() in font_info:
+            continue
         try:
-            font_path: pathlib.Path = pathlib.Path(font)
-            pil_font = ImageFont.truetype(font_path)
-            pil_font_name = pil_font.getname()
-
-            # style and weight and stretch are all in the same font "style" field
-            style_split = pil_font_name[1].split(" ")
-            style: str = "normal"
-            weight: str = "normal"
-            stretch: str = "normal"
-            for s in style_split:
-                if s.casefold() in FONT_STYLES:
-                    style = s.casefold()
-                elif s.casefold() in FONT_WEIGHTS:
-                    weight = s.casefold()
-                elif s.casefold() in FONT_STRETCHES:
-                    stretch = s.casefold()
-
-            font_info[font_path.stem.casefold()] = {
-                "path": str(font_path),
-                "name": str(pil_font_name[0]),
-                "style": style,
-                "weight": weight,
-                "stretch": stretch,
-            }
-        except Exception:
-            pass
+            stat = os.stat(font)
+        except OSError:
+            continue
+        cached = old_cache.get(font)
+        if _cache_entry_valid(cached, stat):
+            info = cached["info"]
+            cache[font] = cached
+        else:
+            try:
+                info = _read_font_info(font_path)
+            except Exception:
+                info = None
+            cache[font] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "info": info}
+            cache_changed = True
+        if info is not None:
+            font_info[font_path.stem.casefold()] = info
+
+    if cache_file and (cache_changed or cache.keys() != old_cache.keys()):
+        _save_font_cache(cache_file, cache)
 
     return font_info
+
+
+def group_fonts_by_family(fonts: dict[str, dict[str, str]]) -> dict[str, dict[str, dict[str, str]]]:
+    """
+    Index a font list as returned by `findSystemFonts` by casefolded family
+    name, so a family can be looked up without scanning every font.
+    """
+    families: dict[str, dict[str, dict[str, str]]] = {}
+    for font_id, font_info in fonts.items():
+        families.setdefault(font_info["name"].casefold(), {})[font_id] = font_info
+    return families
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import io
+import json
+from typing import TYPE_CHECKING
+
+import lxml.etree as xml
+from lxml import objectify
+
+import utils
+
+if TYPE_CHECKING:
+    import pathlib
+
+ACBF_SOURCE = b"""<?xml version="1.0" encoding="utf-8"?>
+<ACBF xmlns="http://www.acbf.info/xml/acbf/1.1" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <meta-data>
+    <book-info><book-title lang="en">Title</book-title></book-info>
+  </meta-data>
+  <body>
+    <page><image href="page1.png"/><frame points="1,2 3,4 5,6"/></page>
+  </body>
+</ACBF>
+"""
+
+
+def load_like_acbfdocument(source: bytes) -> xml._ElementTree:
+    # the same namespace stripping ACBFDocument does on load
+    tree = xml.parse(io.BytesIO(source))
+    root = tree.getroot()
+    for elem in root.iter(xml.Element):
+        i = elem.tag.find("}")
+        if i >= 0:
+            elem.tag = elem.tag[i + 1 :]
+    objectify.deannotate(root)
+    return tree
+
+
+def test_write_acbf_round_trip() -> None:
+    tree = load_like_acbfdocument(ACBF_SOURCE)
+    root = tree.getroot()
+
+    output = io.BytesIO()
+    utils.write_acbf(root, output)
+
+    saved = xml.fromstring(output.getvalue())
+    assert saved.tag == f"{{{utils.ACBF_NAMESPACE}}}ACBF"
+    assert "xmlns" not in saved.attrib
+    ns = {"a": utils.ACBF_NAMESPACE}
+    assert saved.findtext("a:meta-data/a:book-info/a:book-title", namespaces=ns) == "Title"
+    assert saved.find("a:body/a:page/a:frame", namespaces=ns).get("points") == "1,2 3,4 5,6"
+
+    # the loaded tree is left as it was
+    assert [child.tag for child in root] == ["meta-data", "body"]
+    assert tree.find("body/page/image").get("href") == "page1.png"
+
+
+def test_write_acbf_saved_file_loads_again() -> None:
+    output = io.BytesIO()
+    utils.write_acbf(load_like_acbfdocument(ACBF_SOURCE).getroot(), output)
+
+    reloaded = load_like_acbfdocument(output.getvalue())
+    second = io.BytesIO()
+    utils.write_acbf(reloaded.getroot(), second)
+
+    assert second.getvalue() == output.getvalue()
+
+
+def test_find_system_fonts_rescans_bad_cache_entries(tmp_path: pathlib.Path) -> None:
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    fonts = [font_dir / f"font{n}.ttf" for n in range(4)]
+    for font in fonts:
+        font.write_bytes(b"not a font")
+    cache_file = tmp_path / "fonts.json"
+    stats = [font.stat() for font in fonts]
+    cache_file.write_text(
+        json.dumps(
+            {
+                str(fonts[0]): "truncated",
+                str(fonts[1]): {"mtime": stats[1].st_mtime_ns},
+                str(fonts[2]): {"mtime": stats[2].st_mtime_ns, "size": stats[2].st_size, "info": "name"},
+                str(fonts[3]): {"mtime": stats[3].st_mtime_ns, "size": stats[3].st_size, "info": {"name": "x"}},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    assert utils.findSystemFonts(str(font_dir), cache_file=str(cache_file)) == {}
+
+    # every entry was read again, none of the files is a font
+    cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert {path: entry["info"] for path, entry in cache.items()} == {str(font): None for font in fonts}
+
+
+def test_find_system_fonts_drops_uninstalled_fonts(tmp_path: pathlib.Path) -> None:
+    font_dir = tmp_path / "fonts"
+    font_dir.mkdir()
+    font = font_dir / "installed.ttf"
+    font.write_bytes(b"not a font")
+    cache_file = tmp_path / "fonts.json"
+
+    utils.findSystemFonts(str(font_dir), cache_file=str(cache_file))
+    cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    cache[str(font_dir / "uninstalled.ttf")] = cache[str(font)]
+    cache_file.write_text(json.dumps(cache), encoding="utf-8")
+
+    utils.findSystemFonts(str(font_dir), cache_file=str(cache_file))
+    assert list(json.loads(cache_file.read_text(encoding="utf-8"))) == [str(font)]